@@ -17,7 +17,7 @@ from .types import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestPack:
     name: str
     description: str
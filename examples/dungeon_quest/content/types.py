@@ -69,6 +69,10 @@ class TileType(Enum):
     ENTRANCE = auto()
 
 
+# TileType by value, for decoding packed tile bytes
+_TILE_BY_VALUE: dict[int, TileType] = {t.value: t for t in TileType}
+
+
 class ObjectiveType(Enum):
     DEFEAT_ENCOUNTER = auto()
     REACH_AREA = auto()
@@ -82,7 +86,7 @@ class ObjectiveType(Enum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AbilityDef:
     name: str
     description: str
@@ -96,7 +100,7 @@ class AbilityDef:
     duration: int = 0  # 0 = instant
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassDef:
     char_class: CharacterClass
     base_hp: int
@@ -112,7 +116,7 @@ class ClassDef:
     abilities: tuple[AbilityDef, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CharacterDef:
     name: str
     char_class: CharacterClass
@@ -125,7 +129,7 @@ class CharacterDef:
     starting_equipment: tuple[str, ...] = ()  # item_ids
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemDef:
     item_id: str
     name: str
@@ -142,7 +146,7 @@ class ItemDef:
     class_restriction: CharacterClass | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnemyDef:
     enemy_id: str
     name: str
@@ -157,7 +161,7 @@ class EnemyDef:
     loot_table: tuple[tuple[str, float], ...] = ()  # (item_id, drop_chance)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EncounterDef:
     encounter_id: str
     enemies: tuple[str, ...]  # enemy_ids
@@ -168,7 +172,7 @@ class EncounterDef:
     on_victory_set_flag: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DialogueChoice:
     text: str
     next_node_id: str
@@ -176,7 +180,7 @@ class DialogueChoice:
     sets_flag: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DialogueNode:
     node_id: str
     speaker: str
@@ -189,15 +193,28 @@ class DialogueNode:
     heals_party: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DialogueTree:
     dialogue_id: str
     nodes: tuple[DialogueNode, ...]  # first node is entry point
     required_flag: str | None = None
     repeatable: bool = True
+    _node_index: dict[str, DialogueNode] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        index: dict[str, DialogueNode] = {}
+        for node in self.nodes:
+            index.setdefault(node.node_id, node)
+        object.__setattr__(self, "_node_index", index)
 
+    def get_node(self, node_id: str) -> DialogueNode | None:
+        """Node with *node_id*; the first one if the id repeats."""
+        return self._node_index.get(node_id)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TileTrigger:
     x: int
     y: int
@@ -209,20 +226,43 @@ class TileTrigger:
     text: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DungeonLevel:
     level_id: str
     name: str
     width: int
     height: int
-    tiles: tuple[tuple[TileType, ...], ...]  # rows of tile types
+    tiles: bytes  # row-major TileType values, built with pack_tiles()
     player_start: tuple[int, int] = (1, 1)
     triggers: tuple[TileTrigger, ...] = ()
     random_encounter_ids: tuple[str, ...] = ()
     random_encounter_chance: float = 0.1
+    _trigger_index: dict[tuple[int, int], tuple[TileTrigger, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        index: dict[tuple[int, int], tuple[TileTrigger, ...]] = {}
+        for trigger in self.triggers:
+            pos = (trigger.x, trigger.y)
+            index[pos] = index.get(pos, ()) + (trigger,)
+        object.__setattr__(self, "_trigger_index", index)
+
+    def get_tile(self, x: int, y: int) -> TileType:
+        """Tile at (x, y); the caller checks bounds."""
+        return _TILE_BY_VALUE[self.tiles[y * self.width + x]]
+
+    def triggers_at(self, x: int, y: int) -> tuple[TileTrigger, ...]:
+        """Triggers on (x, y), in declaration order."""
+        return self._trigger_index.get((x, y), ())
+
+
+def pack_tiles(rows: tuple[tuple[TileType, ...], ...]) -> bytes:
+    """Flatten rows of tile types into DungeonLevel.tiles form."""
+    return bytes(tile.value for row in rows for tile in row)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AreaConnection:
     target_area_id: str
     label: str
@@ -230,7 +270,7 @@ class AreaConnection:
     locked_text: str = "The way is blocked."
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OverworldArea:
     area_id: str
     name: str
@@ -241,7 +281,7 @@ class OverworldArea:
     rest_available: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObjectiveDef:
     objective_id: str
     description: str
@@ -250,7 +290,7 @@ class ObjectiveDef:
     required_flag: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuestDef:
     quest_id: str
     name: str
@@ -4,7 +4,32 @@ from __future__ import annotations
 
 from ..context import GameContext
 from ..state import Character, DungeonQuestState
-from ...content.types import ItemType
+from ...content.types import EquipmentSlot, ItemType
+
+_SLOT_FIELDS = {
+    EquipmentSlot.WEAPON: "weapon_id",
+    EquipmentSlot.ARMOR: "armor_id",
+    EquipmentSlot.ACCESSORY: "accessory_id",
+}
+
+
+def iter_equipment(char: Character) -> tuple[tuple[EquipmentSlot, str | None], ...]:
+    """(slot, item_id) for each equipment slot, in display order."""
+    return (
+        (EquipmentSlot.WEAPON, char.weapon_id),
+        (EquipmentSlot.ARMOR, char.armor_id),
+        (EquipmentSlot.ACCESSORY, char.accessory_id),
+    )
+
+
+def get_equipped(char: Character, slot: EquipmentSlot) -> str | None:
+    """The item_id equipped in *slot*, or None."""
+    return getattr(char, _SLOT_FIELDS[slot])
+
+
+def set_equipped(char: Character, slot: EquipmentSlot, item_id: str | None) -> None:
+    """Set (or clear, with None) the item_id equipped in *slot*."""
+    setattr(char, _SLOT_FIELDS[slot], item_id)
 
 
 def equip_item(
@@ -22,12 +47,12 @@ def equip_item(
         return None
 
     # Unequip current item in that slot
-    current = char.equipment.get(item.slot)
+    current = get_equipped(char, item.slot)
     if current:
         state.inventory.append(current)
 
     state.inventory.remove(item_id)
-    char.equipment[item.slot] = item_id
+    set_equipped(char, item.slot, item_id)
 
     # Apply HP/MP bonuses
     if item.hp_bonus:
@@ -41,14 +66,14 @@ def equip_item(
 
 
 def unequip_item(
-    char: Character, slot, state: DungeonQuestState, ctx: GameContext
+    char: Character, slot: EquipmentSlot, state: DungeonQuestState, ctx: GameContext
 ) -> str | None:
     """Unequip from a slot. Returns message or None."""
-    item_id = char.equipment.get(slot)
+    item_id = get_equipped(char, slot)
     if not item_id:
         return None
     item = ctx.items[item_id]
-    char.equipment[slot] = None
+    set_equipped(char, slot, None)
     state.inventory.append(item_id)
 
     # Remove HP/MP bonuses
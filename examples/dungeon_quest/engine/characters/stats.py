@@ -12,6 +12,9 @@ from ...content.types import (
     ItemDef,
 )
 
+# Abilities listed on the party screen
+VISIBLE_ABILITIES = 5
+
 
 def create_character(char_def: CharacterDef, class_def: ClassDef) -> Character:
     """Create a runtime Character from content definitions."""
@@ -29,6 +32,7 @@ def create_character(char_def: CharacterDef, class_def: ClassDef) -> Character:
         char_class=char_def.char_class,
         level=level,
         xp=0,
+        xp_to_next=xp_for_level(level + 1),
         current_hp=max_hp,
         max_hp=max_hp,
         current_mp=max_mp,
@@ -37,44 +41,51 @@ def create_character(char_def: CharacterDef, class_def: ClassDef) -> Character:
         base_defense=base_def,
         base_speed=base_spd,
         abilities=abilities,
+        visible_abilities=tuple(abilities[:VISIBLE_ABILITIES]),
     )
 
 
+# (attack, defense) direction of each stat-changing buff effect
+_BUFF_DIRECTIONS: dict[AbilityEffect, tuple[int, int]] = {
+    AbilityEffect.BUFF_ATTACK: (1, 0),
+    AbilityEffect.DEBUFF_ATTACK: (-1, 0),
+    AbilityEffect.BUFF_DEFENSE: (0, 1),
+    AbilityEffect.DEBUFF_DEFENSE: (0, -1),
+}
+
+
+def effective_stats(char: Character, ctx: GameContext) -> tuple[int, int, int]:
+    """(attack, defense, speed) including equipment; buffs change attack and defense."""
+    atk, dfn, spd = char.base_attack, char.base_defense, char.base_speed
+    items = ctx.items
+    for item_id in (char.weapon_id, char.armor_id, char.accessory_id):
+        if item_id:
+            item = items.get(item_id)
+            if item:
+                atk += item.attack_bonus
+                dfn += item.defense_bonus
+                spd += item.speed_bonus
+    for buff in char.buffs:
+        direction = _BUFF_DIRECTIONS.get(buff.effect)
+        if direction:
+            atk += direction[0] * buff.power
+            dfn += direction[1] * buff.power
+    return max(0, atk), max(0, dfn), max(0, spd)
+
+
 def effective_attack(char: Character, ctx: GameContext) -> int:
     """Total attack including equipment and buffs."""
-    total = char.base_attack
-    for slot, item_id in char.equipment.items():
-        if item_id and item_id in ctx.items:
-            total += ctx.items[item_id].attack_bonus
-    for buff in char.buffs:
-        if buff.effect == AbilityEffect.BUFF_ATTACK:
-            total += buff.power
-        elif buff.effect == AbilityEffect.DEBUFF_ATTACK:
-            total -= buff.power
-    return max(0, total)
+    return effective_stats(char, ctx)[0]
 
 
 def effective_defense(char: Character, ctx: GameContext) -> int:
     """Total defense including equipment and buffs."""
-    total = char.base_defense
-    for slot, item_id in char.equipment.items():
-        if item_id and item_id in ctx.items:
-            total += ctx.items[item_id].defense_bonus
-    for buff in char.buffs:
-        if buff.effect == AbilityEffect.BUFF_DEFENSE:
-            total += buff.power
-        elif buff.effect == AbilityEffect.DEBUFF_DEFENSE:
-            total -= buff.power
-    return max(0, total)
+    return effective_stats(char, ctx)[1]
 
 
 def effective_speed(char: Character, ctx: GameContext) -> int:
     """Total speed including equipment."""
-    total = char.base_speed
-    for slot, item_id in char.equipment.items():
-        if item_id and item_id in ctx.items:
-            total += ctx.items[item_id].speed_bonus
-    return max(0, total)
+    return effective_stats(char, ctx)[2]
 
 
 def xp_for_level(level: int) -> int:
@@ -84,12 +95,12 @@ def xp_for_level(level: int) -> int:
 
 def check_level_up(char: Character, class_def: ClassDef) -> bool:
     """Check and apply level-up if XP threshold is met. Returns True if leveled up."""
-    needed = xp_for_level(char.level + 1)
-    if char.xp < needed:
+    if char.xp < char.xp_to_next:
         return False
 
-    char.xp -= needed
+    char.xp -= char.xp_to_next
     char.level += 1
+    char.xp_to_next = xp_for_level(char.level + 1)
     char.max_hp += class_def.hp_per_level
     char.max_mp += class_def.mp_per_level
     char.base_attack += class_def.attack_per_level
@@ -102,6 +113,7 @@ def check_level_up(char: Character, class_def: ClassDef) -> bool:
     for ability in class_def.abilities:
         if ability.level_required == char.level and ability not in char.abilities:
             char.abilities.append(ability)
+    char.visible_abilities = tuple(char.abilities[:VISIBLE_ABILITIES])
 
     return True
 
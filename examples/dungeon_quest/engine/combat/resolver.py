@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import random
 
-from ...content.types import AbilityDef, AbilityEffect, TargetType
+from ...content.types import AbilityDef, AbilityEffect, EnemyDef, TargetType
 from ..context import GameContext
 from ..dice import d20, roll_attack, roll_damage, roll_initiative
 from ..state import ActiveBuff, Character, CombatState, DungeonQuestState, Enemy
 from ..characters.stats import effective_attack, effective_defense, effective_speed
+from ..quests.tracker import set_flag
 
 
 def init_combat(
@@ -92,6 +93,73 @@ def resolve_attack(
     return messages
 
 
+def _apply_damage(
+    ability: AbilityDef,
+    target: Character | Enemy,
+    state: DungeonQuestState,
+    ctx: GameContext,
+    messages: list[str],
+) -> None:
+    if isinstance(target, Character):
+        target_def = effective_defense(target, ctx)
+    else:
+        target_def = target.defense
+    dmg = max(1, ability.power + d20() // 4 - target_def // 2)
+    is_defending = (
+        isinstance(target, Character)
+        and target.name in state.combat.defending
+    )
+    if is_defending:
+        dmg = max(1, dmg // 2)
+    target.current_hp = max(0, target.current_hp - dmg)
+    messages.append(f"  {target.name} takes {dmg} {ability.damage_type.name} damage.")
+    if target.current_hp <= 0:
+        target.is_dead = True
+        messages.append(f"  {target.name} is defeated!")
+
+
+def _apply_heal(
+    ability: AbilityDef,
+    target: Character | Enemy,
+    state: DungeonQuestState,
+    ctx: GameContext,
+    messages: list[str],
+) -> None:
+    heal = ability.power + d20() // 4
+    old_hp = target.current_hp
+    target.current_hp = min(target.max_hp, target.current_hp + heal)
+    actual = target.current_hp - old_hp
+    messages.append(f"  {target.name} is healed for {actual} HP.")
+
+
+def _apply_buff(
+    ability: AbilityDef,
+    target: Character | Enemy,
+    state: DungeonQuestState,
+    ctx: GameContext,
+    messages: list[str],
+) -> None:
+    buff = ActiveBuff(
+        effect=ability.effect,
+        power=ability.power,
+        remaining_turns=max(1, ability.duration),
+        source_name=ability.name,
+    )
+    target.buffs.append(buff)
+    effect_name = ability.effect.name.replace("_", " ").title()
+    messages.append(f"  {target.name} gains {effect_name} ({ability.power}) for {buff.remaining_turns} turns.")
+
+
+_EFFECT_HANDLERS = {
+    AbilityEffect.DAMAGE: _apply_damage,
+    AbilityEffect.HEAL: _apply_heal,
+    AbilityEffect.BUFF_ATTACK: _apply_buff,
+    AbilityEffect.BUFF_DEFENSE: _apply_buff,
+    AbilityEffect.DEBUFF_ATTACK: _apply_buff,
+    AbilityEffect.DEBUFF_DEFENSE: _apply_buff,
+}
+
+
 def apply_ability(
     user_name: str,
     ability: AbilityDef,
@@ -104,53 +172,10 @@ def apply_ability(
     messages: list[str] = []
     messages.append(f"{user_name} uses {ability.name}!")
 
-    for target in targets:
-        if ability.effect == AbilityEffect.DAMAGE:
-            # Damage ability
-            if isinstance(target, Character):
-                target_def = effective_defense(target, ctx)
-            else:
-                target_def = target.defense
-            dmg = max(1, ability.power + d20() // 4 - target_def // 2)
-            is_defending = (
-                isinstance(target, Character)
-                and target.name in state.combat.defending
-            )
-            if is_defending:
-                dmg = max(1, dmg // 2)
-            target.current_hp = max(0, target.current_hp - dmg)
-            messages.append(f"  {target.name} takes {dmg} {ability.damage_type.name} damage.")
-            if target.current_hp <= 0:
-                target.is_dead = True
-                messages.append(f"  {target.name} is defeated!")
-
-        elif ability.effect == AbilityEffect.HEAL:
-            heal = ability.power + d20() // 4
-            if isinstance(target, Character):
-                old_hp = target.current_hp
-                target.current_hp = min(target.max_hp, target.current_hp + heal)
-                actual = target.current_hp - old_hp
-            else:
-                old_hp = target.current_hp
-                target.current_hp = min(target.max_hp, target.current_hp + heal)
-                actual = target.current_hp - old_hp
-            messages.append(f"  {target.name} is healed for {actual} HP.")
-
-        elif ability.effect in (
-            AbilityEffect.BUFF_ATTACK,
-            AbilityEffect.BUFF_DEFENSE,
-            AbilityEffect.DEBUFF_ATTACK,
-            AbilityEffect.DEBUFF_DEFENSE,
-        ):
-            buff = ActiveBuff(
-                effect=ability.effect,
-                power=ability.power,
-                remaining_turns=max(1, ability.duration),
-                source_name=ability.name,
-            )
-            target.buffs.append(buff)
-            effect_name = ability.effect.name.replace("_", " ").title()
-            messages.append(f"  {target.name} gains {effect_name} ({ability.power}) for {buff.remaining_turns} turns.")
+    handler = _EFFECT_HANDLERS.get(ability.effect)
+    if handler:
+        for target in targets:
+            handler(ability, target, state, ctx, messages)
 
     return messages
 
@@ -167,6 +192,16 @@ def check_combat_end(state: DungeonQuestState) -> str | None:
     return None
 
 
+def roll_loot(edef: EnemyDef) -> list[str]:
+    """Item ids dropped by one defeated enemy.
+
+    Each loot_table entry is an independent drop chance, so a boss can
+    drop several items.
+    """
+    rand = random.random
+    return [item_id for item_id, chance in edef.loot_table if rand() < chance]
+
+
 def award_victory(state: DungeonQuestState, ctx: GameContext) -> list[str]:
     """Calculate and apply victory rewards. Returns messages."""
     enc = ctx.encounters[state.combat.encounter_id]
@@ -180,9 +215,8 @@ def award_victory(state: DungeonQuestState, ctx: GameContext) -> list[str]:
         edef = ctx.enemies[enemy.enemy_id]
         total_xp += edef.xp_reward
         total_gold += edef.gold_reward
-        for item_id, chance in edef.loot_table:
-            if random.random() < chance:
-                loot.append(item_id)
+        if edef.loot_table:
+            loot += roll_loot(edef)
 
     state.combat.pending_xp = total_xp
     state.combat.pending_gold = total_gold
@@ -207,7 +241,7 @@ def award_victory(state: DungeonQuestState, ctx: GameContext) -> list[str]:
 
     # Set encounter flag
     if enc.on_victory_set_flag:
-        state.quest.flags.add(enc.on_victory_set_flag)
+        set_flag(state, enc.on_victory_set_flag)
 
     if enc.victory_text:
         messages.append(enc.victory_text)
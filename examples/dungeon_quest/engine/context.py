@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 
 from ..content.pack import QuestPack
@@ -29,24 +30,39 @@ class GameContext:
     dungeon_levels: dict[str, DungeonLevel] = field(default_factory=dict)
     classes: dict[CharacterClass, ClassDef] = field(default_factory=dict)
     quests: dict[str, QuestDef] = field(default_factory=dict)
+    # Small int per dungeon level, used to pack trigger keys
+    level_index: dict[str, int] = field(default_factory=dict)
+    # area_id -> (dialogue_id, speaker, tree) for each NPC with a known dialogue
+    area_npcs: dict[str, tuple[tuple[str, str, DialogueTree], ...]] = field(default_factory=dict)
 
     @classmethod
     def from_quest_pack(cls, pack: QuestPack) -> GameContext:
+        # Ids are interned so packs built at runtime (not from literals)
+        # still get identity-fast key compares
+        intern = sys.intern
         ctx = cls(quest_pack=pack)
         for item in pack.items:
-            ctx.items[item.item_id] = item
+            ctx.items[intern(item.item_id)] = item
         for enemy in pack.enemies:
-            ctx.enemies[enemy.enemy_id] = enemy
+            ctx.enemies[intern(enemy.enemy_id)] = enemy
         for enc in pack.encounters:
-            ctx.encounters[enc.encounter_id] = enc
+            ctx.encounters[intern(enc.encounter_id)] = enc
         for dlg in pack.dialogues:
-            ctx.dialogues[dlg.dialogue_id] = dlg
+            ctx.dialogues[intern(dlg.dialogue_id)] = dlg
         for area in pack.areas:
-            ctx.areas[area.area_id] = area
+            ctx.areas[intern(area.area_id)] = area
         for level in pack.dungeon_levels:
-            ctx.dungeon_levels[level.level_id] = level
+            level_id = intern(level.level_id)
+            ctx.dungeon_levels[level_id] = level
+            ctx.level_index.setdefault(level_id, len(ctx.level_index))
         for cls_def in pack.classes:
             ctx.classes[cls_def.char_class] = cls_def
         for quest in pack.quests:
             ctx.quests[quest.quest_id] = quest
+        for area in pack.areas:
+            ctx.area_npcs[area.area_id] = tuple(
+                (dlg_id, dlg.nodes[0].speaker if dlg.nodes else "NPC", dlg)
+                for dlg_id in area.npcs
+                if (dlg := ctx.dialogues.get(dlg_id)) is not None
+            )
         return ctx
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from ..context import GameContext
 from ..state import DialogueState, DungeonQuestState
+from ..quests.tracker import set_flag
 from ...content.types import DialogueNode, DialogueTree
 
 
@@ -43,10 +44,7 @@ def get_current_node(
     if not tree:
         return None
 
-    for node in tree.nodes:
-        if node.node_id == node_id:
-            return node
-    return None
+    return tree.get_node(node_id)
 
 
 def get_available_choices(
@@ -71,7 +69,7 @@ def apply_node_effects(
     message = None
 
     if node.sets_flag:
-        state.quest.flags.add(node.sets_flag)
+        set_flag(state, node.sets_flag)
 
     if node.gives_item:
         state.inventory.append(node.gives_item)
@@ -110,7 +108,7 @@ def advance_dialogue(
             orig_idx = available[choice_index][0]
             choice = node.choices[orig_idx]
             if choice.sets_flag:
-                state.quest.flags.add(choice.sets_flag)
+                set_flag(state, choice.sets_flag)
             next_node_id = choice.next_node_id
     elif node.next_node_id:
         next_node_id = node.next_node_id
@@ -127,7 +125,7 @@ def advance_dialogue(
     # Mark dialogue as used
     dlg_id = state.dialogue.active_dialogue_id
     if dlg_id:
-        state.quest.flags.add(f"talked_{dlg_id}")
+        set_flag(state, f"talked_{dlg_id}")
 
     state.dialogue.active_dialogue_id = None
     state.dialogue.current_node_id = None
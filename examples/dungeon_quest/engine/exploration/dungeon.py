@@ -6,6 +6,7 @@ import random
 
 from ..context import GameContext
 from ..state import DungeonQuestState
+from ..quests.tracker import set_flag
 from ...content.types import DungeonLevel, TileType
 
 
@@ -13,8 +14,12 @@ def can_move(level: DungeonLevel, x: int, y: int) -> bool:
     """Check if a tile is walkable."""
     if x < 0 or y < 0 or y >= level.height or x >= level.width:
         return False
-    tile = level.tiles[y][x]
-    return tile != TileType.WALL
+    return level.get_tile(x, y) is not TileType.WALL
+
+
+def trigger_key(level_index: int, x: int, y: int) -> int:
+    """Pack a trigger position into one int for ExplorationState.triggered_once."""
+    return (level_index << 32) | (x << 16) | y
 
 
 def move_player(
@@ -38,36 +43,33 @@ def move_player(
     state.exploration.player_x = nx
     state.exploration.player_y = ny
 
-    tile = level.tiles[ny][nx]
+    tile = level.get_tile(nx, ny)
     encounter_id = None
     dialogue_id = None
     message = None
 
     # Check triggers
-    for trigger in level.triggers:
-        if trigger.x == nx and trigger.y == ny:
-            trigger_key = f"{nx},{ny},{level_id}"
-
-            if trigger.once and trigger_key in state.exploration.triggered_once:
+    for trigger in level.triggers_at(nx, ny):
+        if trigger.once:
+            key = trigger_key(ctx.level_index[level_id], nx, ny)
+            if key in state.exploration.triggered_once:
                 continue
-
-            if trigger.once:
-                state.exploration.triggered_once.add(trigger_key)
-
-            if trigger.text:
-                message = trigger.text
-
-            if trigger.encounter_id:
-                encounter_id = trigger.encounter_id
-            if trigger.dialogue_id:
-                dialogue_id = trigger.dialogue_id
-            if trigger.item_id:
-                state.inventory.append(trigger.item_id)
-                if trigger.item_id in ctx.items:
-                    message = f"Found: {ctx.items[trigger.item_id].name}!"
-            if trigger.sets_flag:
-                state.quest.flags.add(trigger.sets_flag)
-            break
+            state.exploration.triggered_once.add(key)
+
+        if trigger.text:
+            message = trigger.text
+
+        if trigger.encounter_id:
+            encounter_id = trigger.encounter_id
+        if trigger.dialogue_id:
+            dialogue_id = trigger.dialogue_id
+        if trigger.item_id:
+            state.inventory.append(trigger.item_id)
+            if trigger.item_id in ctx.items:
+                message = f"Found: {ctx.items[trigger.item_id].name}!"
+        if trigger.sets_flag:
+            set_flag(state, trigger.sets_flag)
+        break
 
     # Random encounters on floor tiles
     if (
@@ -89,7 +91,7 @@ def get_current_tile(state: DungeonQuestState, ctx: GameContext) -> TileType | N
     level = ctx.dungeon_levels[level_id]
     x, y = state.exploration.player_x, state.exploration.player_y
     if 0 <= y < level.height and 0 <= x < level.width:
-        return level.tiles[y][x]
+        return level.get_tile(x, y)
     return None
 
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from ..context import GameContext
 from ..state import DungeonQuestState
+from ..quests.tracker import set_flag
+from ..types import ActionKind
 from ...content.types import OverworldArea
 
 
@@ -52,7 +54,7 @@ def travel_to_area(
     state.exploration.overworld_cursor = 0
 
     # Set reach_area flag for quest tracking
-    state.quest.flags.add(f"reached_{target_area_id}")
+    set_flag(state, f"reached_{target_area_id}")
 
     return None
 
@@ -61,37 +63,40 @@ def get_area_actions(
     area: OverworldArea,
     state: DungeonQuestState,
     ctx: GameContext,
-) -> list[str]:
-    """Get list of available actions in current area."""
-    actions = []
+) -> list[tuple[str, ActionKind, object]]:
+    """Get (label, kind, payload) for each available action in current area.
+
+    TRAVEL and TRAVEL_LOCKED carry the AreaConnection, TALK the dialogue
+    id, and the rest None.
+    """
+    actions: list[tuple[str, ActionKind, object]] = []
 
     # Travel options
     for conn in area.connections:
-        locked = conn.required_flag and conn.required_flag not in state.quest.flags
-        prefix = "[Locked] " if locked else ""
-        actions.append(f"Travel: {prefix}{conn.label}")
+        if conn.required_flag and conn.required_flag not in state.quest.flags:
+            actions.append((f"Travel: [Locked] {conn.label}", ActionKind.TRAVEL_LOCKED, conn))
+        else:
+            actions.append((f"Travel: {conn.label}", ActionKind.TRAVEL, conn))
 
     # Dungeon entry
     if area.dungeon_levels:
-        actions.append("Enter Dungeon")
+        actions.append(("Enter Dungeon", ActionKind.DUNGEON, None))
 
     # NPCs
-    for dlg_id in area.npcs:
-        if dlg_id in ctx.dialogues:
-            dlg = ctx.dialogues[dlg_id]
-            if dlg.required_flag and dlg.required_flag not in state.quest.flags:
-                continue
-            if not dlg.repeatable and dlg_id in state.quest.flags:
-                continue
-            speaker = dlg.nodes[0].speaker if dlg.nodes else "NPC"
-            actions.append(f"Talk: {speaker}")
+    flags = state.quest.flags
+    for dlg_id, speaker, dlg in ctx.area_npcs.get(area.area_id, ()):
+        if dlg.required_flag and dlg.required_flag not in flags:
+            continue
+        if not dlg.repeatable and dlg_id in flags:
+            continue
+        actions.append((f"Talk: {speaker}", ActionKind.TALK, dlg_id))
 
     # Rest
     if area.rest_available:
-        actions.append("Rest")
+        actions.append(("Rest", ActionKind.REST, None))
 
     # Always available
-    actions.append("Party")
-    actions.append("Inventory")
+    actions.append(("Party", ActionKind.PARTY, None))
+    actions.append(("Inventory", ActionKind.INVENTORY, None))
 
     return actions
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import sys
+
 from ..context import GameContext
 from ..state import DungeonQuestState
 from ...content.types import ObjectiveType
 
 
+def set_flag(state: DungeonQuestState, flag: str) -> None:
+    """Set a quest flag, interned so membership tests can match by identity."""
+    state.quest.flags.add(sys.intern(flag))
+
+
 def check_objective(
     objective_id: str,
     state: DungeonQuestState,
@@ -43,8 +50,12 @@ def check_objective(
     return False
 
 
-def update_quests(state: DungeonQuestState, ctx: GameContext) -> list[str]:
-    """Check all active quests for completion. Returns messages."""
+def update_quests(state: DungeonQuestState, ctx: GameContext) -> tuple[list[str], bool]:
+    """Check all active quests for completion.
+
+    Returns (messages, victory), where victory is True when the pack's
+    victory flag is set and the game has not been won yet.
+    """
     messages: list[str] = []
 
     # Auto-activate quests that don't have prerequisites
@@ -77,7 +88,7 @@ def update_quests(state: DungeonQuestState, ctx: GameContext) -> list[str]:
         if all_complete:
             state.quest.active_quests.remove(quest_id)
             state.quest.completed_quests.append(quest_id)
-            state.quest.flags.add(quest.completion_flag)
+            set_flag(state, quest.completion_flag)
 
             # Award rewards
             if quest.rewards_xp:
@@ -99,4 +110,5 @@ def update_quests(state: DungeonQuestState, ctx: GameContext) -> list[str]:
 
             messages.append(f"Quest complete: {quest.name}!")
 
-    return messages
+    victory = not state.game_won and ctx.quest_pack.victory_flag in state.quest.flags
+    return messages, victory
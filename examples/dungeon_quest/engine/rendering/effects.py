@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import math
 import random
+from collections.abc import Iterable
 
 import pygame
 
@@ -38,7 +39,13 @@ class EffectManager:
     def add(self, effect: Effect) -> None:
         self._effects.append(effect)
 
+    def add_many(self, effects: Iterable[Effect]) -> None:
+        """Add several effects in one call."""
+        self._effects.extend(effects)
+
     def update(self, dt: float) -> None:
+        if not self._effects:
+            return
         self._effects = [e for e in self._effects if e.update(dt)]
 
     def render(self, surface: pygame.Surface) -> None:
@@ -0,0 +1,39 @@
+"""Whole-frame cache for scenes that redraw more often than they change."""
+
+from __future__ import annotations
+
+import pygame
+
+
+class FrameCache:
+    """Keeps a copy of the last drawn frame until invalidated.
+
+    Scenes call invalidate() whenever something visible changes, try
+    blit() at the top of render(), and store() after a full redraw.
+    Only worth it when render() runs on frames where nothing changed
+    (e.g. the dialogue typewriter); scenes that only change on input
+    keep a plain dirty flag instead.
+    """
+
+    def __init__(self) -> None:
+        self._frame: pygame.Surface | None = None
+        self.dirty = True
+
+    def invalidate(self) -> None:
+        self.dirty = True
+
+    def blit(self, surface: pygame.Surface) -> bool:
+        """Blit the cached frame. Return False if a redraw is needed."""
+        frame = self._frame
+        if self.dirty or frame is None or frame.get_size() != surface.get_size():
+            return False
+        surface.blit(frame, (0, 0))
+        return True
+
+    def store(self, surface: pygame.Surface) -> None:
+        """Snapshot *surface* as the current frame."""
+        if self._frame is None or self._frame.get_size() != surface.get_size():
+            self._frame = surface.copy()
+        else:
+            self._frame.blit(surface, (0, 0))
+        self.dirty = False
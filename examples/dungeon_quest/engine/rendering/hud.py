@@ -10,6 +10,50 @@ from . import colors, fonts
 from .sprites import SpriteCache
 
 
+# Bars and HP labels only depend on their numbers, so each distinct one is
+# drawn once; the caches are dropped wholesale if they grow past this.
+BAR_CACHE_SIZE = 256
+
+_bar_cache: dict[tuple[str, int, int, int, int], pygame.Surface] = {}
+_label_cache: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _bar(kind: str, width: int, height: int, current: int, maximum: int) -> pygame.Surface:
+    key = (kind, width, height, current, maximum)
+    bar = _bar_cache.get(key)
+    if bar is not None:
+        return bar
+    if len(_bar_cache) >= BAR_CACHE_SIZE:
+        _bar_cache.clear()
+
+    bar = pygame.Surface((width, height))
+    if kind == "hp":
+        bar.fill(colors.HP_BG)
+        if maximum > 0:
+            ratio = max(0, min(1, current / maximum))
+            bar_color = colors.HP_GREEN if ratio > 0.3 else colors.HP_RED
+            bar.fill(bar_color, (0, 0, int(width * ratio), height))
+    else:
+        bar.fill(colors.MP_BG)
+        if maximum > 0:
+            ratio = max(0, min(1, current / maximum))
+            bar.fill(colors.MP_BLUE, (0, 0, int(width * ratio), height))
+    pygame.draw.rect(bar, colors.PANEL_BORDER, bar.get_rect(), 1)
+    _bar_cache[key] = bar
+    return bar
+
+
+def _hp_label(current: int, maximum: int) -> pygame.Surface:
+    key = (current, maximum)
+    label = _label_cache.get(key)
+    if label is None:
+        if len(_label_cache) >= BAR_CACHE_SIZE:
+            _label_cache.clear()
+        label = fonts.small().render(f"{current}/{maximum}", True, colors.WHITE)
+        _label_cache[key] = label
+    return label
+
+
 def draw_hp_bar(
     surface: pygame.Surface,
     x: int,
@@ -20,20 +64,13 @@ def draw_hp_bar(
     height: int = 12,
 ) -> None:
     """Draw an HP bar."""
-    bg_rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(surface, colors.HP_BG, bg_rect)
-    if maximum > 0:
-        ratio = max(0, min(1, current / maximum))
-        fill_w = int(width * ratio)
-        bar_color = colors.HP_GREEN if ratio > 0.3 else colors.HP_RED
-        fill_rect = pygame.Rect(x, y, fill_w, height)
-        pygame.draw.rect(surface, bar_color, fill_rect)
-    pygame.draw.rect(surface, colors.PANEL_BORDER, bg_rect, 1)
-
-    font = fonts.small()
-    text = f"{current}/{maximum}"
-    text_surf = font.render(text, True, colors.WHITE)
-    surface.blit(text_surf, (x + width + 4, y - 1))
+    surface.blits(
+        [
+            (_bar("hp", width, height, current, maximum), (x, y)),
+            (_hp_label(current, maximum), (x + width + 4, y - 1)),
+        ],
+        doreturn=False,
+    )
 
 
 def draw_mp_bar(
@@ -46,13 +83,7 @@ def draw_mp_bar(
     height: int = 10,
 ) -> None:
     """Draw an MP bar."""
-    bg_rect = pygame.Rect(x, y, width, height)
-    pygame.draw.rect(surface, colors.MP_BG, bg_rect)
-    if maximum > 0:
-        ratio = max(0, min(1, current / maximum))
-        fill_rect = pygame.Rect(x, y, int(width * ratio), height)
-        pygame.draw.rect(surface, colors.MP_BLUE, fill_rect)
-    pygame.draw.rect(surface, colors.PANEL_BORDER, bg_rect, 1)
+    surface.blit(_bar("mp", width, height, current, maximum), (x, y))
 
 
 def draw_party_summary(
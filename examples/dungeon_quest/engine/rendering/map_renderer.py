@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import pygame
 
-from ...content.types import TileType
+from ...content.types import DungeonLevel, TileType
 from . import colors, fonts
 from .sprites import SpriteCache
 
@@ -33,24 +35,32 @@ TILE_SYMBOLS: dict[TileType, str] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _falloff(view_radius: int) -> tuple[float, ...]:
+    """Tile dim level by Manhattan distance, for distances in view."""
+    # Quantized to 0.1 steps so SpriteCache keeps few dimmed variants
+    return tuple(round(max(0.3, 1.0 - d / (view_radius + 1)), 1) for d in range(view_radius + 1))
+
+
 def draw_dungeon(
     surface: pygame.Surface,
     rect: pygame.Rect,
-    tiles: tuple[tuple[TileType, ...], ...],
+    level: DungeonLevel,
     player_x: int,
     player_y: int,
     view_radius: int = 8,
     player_class: str = "",
 ) -> None:
     """Draw the dungeon tile grid centered on the player."""
-    map_height = len(tiles)
-    map_width = len(tiles[0]) if tiles else 0
+    map_height = level.height
+    map_width = level.width
 
     # Calculate viewport offset to center on player
     tiles_x = rect.width // TILE_SIZE
     tiles_y = rect.height // TILE_SIZE
     offset_x = player_x - tiles_x // 2
     offset_y = player_y - tiles_y // 2
+    falloff = _falloff(view_radius)
 
     for sy in range(tiles_y):
         for sx in range(tiles_x):
@@ -65,17 +75,14 @@ def draw_dungeon(
                 pygame.draw.rect(surface, colors.BLACK, tile_rect)
                 continue
 
-            tile = tiles[my][mx]
+            tile = level.get_tile(mx, my)
             dist = abs(mx - player_x) + abs(my - player_y)
 
             if dist > view_radius:
                 pygame.draw.rect(surface, colors.FOG_COLOR, tile_rect)
                 continue
 
-            # Distance-based dimming (quantized to 0.1 steps)
-            dim = max(0.3, 1.0 - dist / (view_radius + 1))
-            dim = round(dim, 1)
-            tile_sprite = SpriteCache.get_tile(tile, dim)
+            tile_sprite = SpriteCache.get_tile(tile, falloff[dist])
             surface.blit(tile_sprite, (px, py))
 
             # Player marker
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import pygame
 
 from . import colors, fonts
@@ -10,17 +12,17 @@ from . import colors, fonts
 def draw_menu(
     surface: pygame.Surface,
     rect: pygame.Rect,
-    items: list[str],
+    items: Sequence[str],
     cursor: int,
     font: pygame.font.Font | None = None,
     text_color: tuple[int, int, int] = colors.WHITE,
     cursor_color: tuple[int, int, int] = colors.CURSOR_COLOR,
-    disabled: set[int] | None = None,
+    disabled: set[int] | frozenset[int] | None = None,
 ) -> None:
     """Draw a vertical menu with cursor highlight."""
     if font is None:
         font = fonts.normal()
-    disabled = disabled or set()
+    disabled = disabled or frozenset()
     line_h = font.get_linesize() + 4
     y = rect.y
 
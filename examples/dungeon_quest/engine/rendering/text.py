@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 import pygame
 
 from . import fonts
@@ -48,21 +50,53 @@ def draw_text(
     return y
 
 
-def draw_typewriter(
-    surface: pygame.Surface,
-    text: str,
-    rect: pygame.Rect,
-    progress: float,
-    color: tuple[int, int, int] = (255, 255, 255),
-    font: pygame.font.Font | None = None,
-    line_spacing: int = 4,
-) -> bool:
-    """Draw text with typewriter effect. progress is 0.0-1.0+.
+class TypewriterText:
+    """Word-wrapped text rendered once and revealed character by character.
 
-    Returns True if all text is displayed.
+    Wrapping is computed for the full text up front, so words no longer
+    jump to the next line as they are typed out.
     """
-    char_count = int(progress * len(text))
-    visible = text[:char_count]
-    done = char_count >= len(text)
-    draw_text(surface, visible, rect, color, font, line_spacing)
-    return done
+
+    def __init__(
+        self,
+        text: str,
+        rect: pygame.Rect,
+        color: tuple[int, int, int] = (255, 255, 255),
+        font: pygame.font.Font | None = None,
+        line_spacing: int = 4,
+    ) -> None:
+        if font is None:
+            font = fonts.normal()
+        self.text = text
+        # (surface, y offset, x offset after each character,
+        #  index into text just past each character)
+        self._lines: list[tuple[pygame.Surface, int, list[int], list[int]]] = []
+        line_h = font.get_linesize()
+        y = 0
+        pos = 0
+        for line in word_wrap(text, font, rect.width):
+            if rect.y + y + line_h > rect.bottom:
+                break
+            # Measured per prefix: summing single-character widths drifts
+            # from the rendered line because of kerning
+            offsets = [font.size(line[:i])[0] for i in range(len(line) + 1)]
+            # Wrapping drops spaces, so map each character back to the source
+            ends = []
+            for ch in line:
+                pos = text.index(ch, pos) + 1
+                ends.append(pos)
+            self._lines.append((font.render(line, True, color), y, offsets, ends))
+            y += line_h + line_spacing
+
+    def draw(self, surface: pygame.Surface, pos: tuple[int, int], chars: int) -> None:
+        """Blit the first *chars* characters of the text at *pos*."""
+        x, y0 = pos
+        for line_surf, dy, offsets, ends in self._lines:
+            shown = bisect_right(ends, chars)
+            if shown == len(ends):
+                surface.blit(line_surf, (x, y0 + dy))
+            else:
+                if shown > 0:
+                    width = offsets[shown]
+                    surface.blit(line_surf, (x, y0 + dy), (0, 0, width, line_surf.get_height()))
+                return
@@ -30,6 +30,7 @@ from ..rendering.combat_renderer import draw_combat_screen
 from ..rendering.effects import (
     BuffEffect,
     DamageNumberEffect,
+    Effect,
     EffectManager,
     HealGlowEffect,
     HitFlashEffect,
@@ -39,9 +40,10 @@ from ..rendering.effects import (
 from ..rendering.layout import Layout
 from ..rendering.panels import draw_panel
 from ..rendering.text import draw_text
-from ..state import DungeonQuestState, Enemy
+from ..state import Character, DungeonQuestState, Enemy
 from ..types import CombatPhase
-from ...content.types import AbilityEffect, DamageType, ItemType, TargetType
+from ...content.types import AbilityDef, AbilityEffect, ItemDef, ItemType, TargetType
+from .game_over import GameOverScene
 
 if TYPE_CHECKING:
     from ludos import GameEngine
@@ -49,6 +51,9 @@ if TYPE_CHECKING:
 
 ACTIONS = ["Attack", "Abilities", "Items", "Defend", "Flee"]
 
+# Number of arena slots per side with precomputed effect positions
+_MAX_SLOTS = 8
+
 
 class CombatScene(BaseScene):
     input_repeat_delay = 0.15
@@ -61,14 +66,29 @@ class CombatScene(BaseScene):
         self._effects = EffectManager()
         self._resolve_delay = 0.0
         self._victory_delay = 0.0
+        self._enemy_positions: list[tuple[int, int]] = []
+        self._ally_positions: list[tuple[int, int]] = []
+        # (character, enemy) resolved once per round, parallel to turn_order
+        self._turn_actors: list[tuple[Character | None, Enemy | None]] = []
+        self._char_by_name: dict[str, Character] = {}
+        self._enemy_by_name: dict[str, Enemy] = {}
 
     def on_enter(self, state: BaseGameState) -> None:
         s = self._cast(state)
         init_combat(self._encounter_id, s, self._ctx)
         s.combat.phase = CombatPhase.ROLLING_INITIATIVE
+        # Name lookups keep the first match, like the old linear scans
+        self._char_by_name = {}
+        for c in s.party:
+            self._char_by_name.setdefault(c.name, c)
+        self._enemy_by_name = {}
+        for e in s.combat.enemies:
+            self._enemy_by_name.setdefault(e.name, e)
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            self._enemy_positions = [self._slot_pos(i, True) for i in range(_MAX_SLOTS)]
+            self._ally_positions = [self._slot_pos(i, False) for i in range(_MAX_SLOTS)]
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         s = self._cast(state)
@@ -145,6 +165,10 @@ class CombatScene(BaseScene):
         if combat.phase == CombatPhase.ROLLING_INITIATIVE:
             combat.turn_order = roll_turn_order(s.party, combat.enemies, self._ctx)
             combat.current_turn_index = 0
+            self._turn_actors = [
+                (self._find_char(s, name), self._find_enemy(s, name))
+                for name in combat.turn_order
+            ]
             combat.combat_log.append("Battle begins!")
             self._advance_turn(s)
 
@@ -203,7 +227,7 @@ class CombatScene(BaseScene):
 
         elif phase == CombatPhase.CHOOSE_ITEM:
             usable = self._usable_items(s)
-            sub_items = [self._ctx.items[iid].name for iid in usable]
+            sub_items = [item.name for _, item in usable]
             sub_cursor = combat.item_cursor
 
         draw_combat_screen(
@@ -255,7 +279,14 @@ class CombatScene(BaseScene):
         return state
 
     def _target_screen_pos(self, index: int, is_enemy: bool) -> tuple[int, int]:
-        """Compute screen position for effects based on arena layout."""
+        """Look up screen position for effects based on arena layout."""
+        positions = self._enemy_positions if is_enemy else self._ally_positions
+        if index < len(positions):
+            return positions[index]
+        return self._slot_pos(index, is_enemy)
+
+    def _slot_pos(self, index: int, is_enemy: bool) -> tuple[int, int]:
+        """Screen position of a combatant slot in the arena layout."""
         if not self._layout:
             return (400, 200)
         layout = self._layout
@@ -269,30 +300,41 @@ class CombatScene(BaseScene):
     def _spawn_attack_effects(self, target_idx: int, is_enemy_target: bool, damage: int | None = None) -> None:
         """Spawn slash + hit flash + damage number on target."""
         x, y = self._target_screen_pos(target_idx, is_enemy_target)
-        self._effects.add(SlashEffect(x, y))
-        self._effects.add(HitFlashEffect(x, y))
-        if damage is not None:
-            text = str(damage)
-            color = colors.DAMAGE_COLOR
-            if damage == 0:
-                text = "MISS"
-                color = colors.LIGHT_GRAY
-            self._effects.add(DamageNumberEffect(x, y - 20, text, color))
+        if damage is None:
+            self._effects.add_many((SlashEffect(x, y), HitFlashEffect(x, y)))
+            return
+        if damage == 0:
+            text, color = "MISS", colors.LIGHT_GRAY
+        else:
+            text, color = str(damage), colors.DAMAGE_COLOR
+        self._effects.add_many((
+            SlashEffect(x, y),
+            HitFlashEffect(x, y),
+            DamageNumberEffect(x, y - 20, text, color),
+        ))
 
     def _spawn_spell_effects(self, target_idx: int, is_enemy_target: bool, damage_type: str = "FIRE", value: int = 0) -> None:
         """Spawn spell particles + damage number."""
         x, y = self._target_screen_pos(target_idx, is_enemy_target)
-        self._effects.add(SpellEffect(x, y, damage_type))
-        self._effects.add(HitFlashEffect(x, y))
         if value:
-            self._effects.add(DamageNumberEffect(x, y - 20, str(value), colors.DAMAGE_COLOR))
+            self._effects.add_many((
+                SpellEffect(x, y, damage_type),
+                HitFlashEffect(x, y),
+                DamageNumberEffect(x, y - 20, str(value), colors.DAMAGE_COLOR),
+            ))
+        else:
+            self._effects.add_many((SpellEffect(x, y, damage_type), HitFlashEffect(x, y)))
 
     def _spawn_heal_effects(self, target_idx: int, is_enemy_target: bool, amount: int = 0) -> None:
         """Spawn heal glow + green number."""
         x, y = self._target_screen_pos(target_idx, is_enemy_target)
-        self._effects.add(HealGlowEffect(x, y))
         if amount:
-            self._effects.add(DamageNumberEffect(x, y - 20, f"+{amount}", colors.HEAL_COLOR))
+            self._effects.add_many((
+                HealGlowEffect(x, y),
+                DamageNumberEffect(x, y - 20, f"+{amount}", colors.HEAL_COLOR),
+            ))
+        else:
+            self._effects.add(HealGlowEffect(x, y))
 
     def _spawn_buff_effects(self, target_idx: int, is_enemy_target: bool, is_debuff: bool = False) -> None:
         """Spawn buff/debuff sparkle."""
@@ -300,6 +342,34 @@ class CombatScene(BaseScene):
         color = colors.DEBUFF_COLOR if is_debuff else colors.BUFF_COLOR
         self._effects.add(BuffEffect(x, y, color))
 
+    def _screen_positions(self, count: int, is_enemy: bool) -> list[tuple[int, int]]:
+        """Screen positions for the first *count* slots on one side."""
+        positions = self._enemy_positions if is_enemy else self._ally_positions
+        if count <= len(positions):
+            return positions[:count]
+        return [self._target_screen_pos(i, is_enemy) for i in range(count)]
+
+    def _spawn_spell_effects_many(self, count: int, is_enemy_target: bool, damage_type: str) -> None:
+        """Spawn spell particles + hit flash on the first *count* targets."""
+        effects: list[Effect] = []
+        for x, y in self._screen_positions(count, is_enemy_target):
+            effects.append(SpellEffect(x, y, damage_type))
+            effects.append(HitFlashEffect(x, y))
+        self._effects.add_many(effects)
+
+    def _spawn_heal_effects_many(self, count: int, is_enemy_target: bool) -> None:
+        """Spawn heal glow on the first *count* targets."""
+        self._effects.add_many(
+            [HealGlowEffect(x, y) for x, y in self._screen_positions(count, is_enemy_target)]
+        )
+
+    def _spawn_buff_effects_many(self, count: int, is_enemy_target: bool) -> None:
+        """Spawn buff sparkle on the first *count* targets."""
+        color = colors.BUFF_COLOR
+        self._effects.add_many(
+            [BuffEffect(x, y, color) for x, y in self._screen_positions(count, is_enemy_target)]
+        )
+
     def _current_char(self, s: DungeonQuestState) -> str | None:
         """Get current actor name from turn order."""
         combat = s.combat
@@ -307,28 +377,39 @@ class CombatScene(BaseScene):
             return combat.turn_order[combat.current_turn_index]
         return None
 
-    def _find_char(self, s: DungeonQuestState, name: str):
-        for c in s.party:
-            if c.name == name:
-                return c
-        return None
-
-    def _find_enemy(self, s: DungeonQuestState, name: str):
-        for e in s.combat.enemies:
-            if e.name == name:
-                return e
-        return None
+    def _find_char(self, s: DungeonQuestState, name: str) -> Character | None:
+        return self._char_by_name.get(name)
+
+    def _find_enemy(self, s: DungeonQuestState, name: str) -> Enemy | None:
+        return self._enemy_by_name.get(name)
+
+    def _lowest_hp_ratio(self, chars: list[Character]) -> Character | None:
+        """Pick the character with the lowest HP fraction (first wins ties)."""
+        best = None
+        best_hp = 0
+        best_max = 1
+        for c in chars:
+            max_hp = c.max_hp or 1
+            # Cross-multiplied c.current_hp / max_hp < best_hp / best_max
+            if best is None or c.current_hp * best_max < best_hp * max_hp:
+                best = c
+                best_hp = c.current_hp
+                best_max = max_hp
+        return best
 
     def _advance_turn(self, s: DungeonQuestState) -> None:
         """Advance to the next living combatant's turn."""
         combat = s.combat
+        turn_order = combat.turn_order
+        turn_actors = self._turn_actors
 
-        while combat.current_turn_index < len(combat.turn_order):
-            name = combat.turn_order[combat.current_turn_index]
+        for index in range(combat.current_turn_index, len(turn_order)):
+            combat.current_turn_index = index
+            name = turn_order[index]
             combat.current_actor = name
 
             # Check if combatant is alive
-            char = self._find_char(s, name)
+            char, enemy = turn_actors[index]
             if char and not char.is_dead:
                 # Tick buffs
                 msgs = tick_buffs(char)
@@ -338,15 +419,13 @@ class CombatScene(BaseScene):
                 combat.combat_log.append(f"--- {name}'s turn ---")
                 return
 
-            enemy = self._find_enemy(s, name)
             if enemy and not enemy.is_dead:
                 combat.phase = CombatPhase.ENEMY_TURN
                 combat.combat_log.append(f"--- {name}'s turn ---")
                 return
 
-            combat.current_turn_index += 1
-
         # All turns done — new round
+        combat.current_turn_index = len(turn_order)
         combat.phase = CombatPhase.ROLLING_INITIATIVE
 
     def _select_action(self, s: DungeonQuestState) -> None:
@@ -433,17 +512,18 @@ class CombatScene(BaseScene):
             return []
         return [a for a in char.abilities if a.cost <= char.current_mp]
 
-    def _usable_items(self, s: DungeonQuestState) -> list[str]:
+    def _usable_items(self, s: DungeonQuestState) -> list[tuple[str, ItemDef]]:
+        """Distinct consumables in the inventory as (item_id, item) pairs."""
+        items = self._ctx.items
         seen: set[str] = set()
-        usable: list[str] = []
+        usable: list[tuple[str, ItemDef]] = []
         for item_id in s.inventory:
             if item_id in seen:
                 continue
             seen.add(item_id)
-            if item_id in self._ctx.items:
-                item = self._ctx.items[item_id]
-                if item.item_type == ItemType.CONSUMABLE:
-                    usable.append(item_id)
+            item = items.get(item_id)
+            if item is not None and item.item_type == ItemType.CONSUMABLE:
+                usable.append((item_id, item))
         return usable
 
     def _use_ability(self, s: DungeonQuestState) -> None:
@@ -457,61 +537,73 @@ class CombatScene(BaseScene):
         ability = usable[combat.ability_cursor % len(usable)]
         char.current_mp -= ability.cost
 
-        # Determine damage type string for effects
-        dmg_type = getattr(ability, "damage_type", DamageType.PHYSICAL)
-        dmg_type_str = dmg_type.name if dmg_type else "PHYSICAL"
+        handler = self._TARGET_HANDLERS.get(ability.target)
+        msgs = handler(self, s, char, ability) if handler else []
 
-        # Determine targets
-        if ability.target == TargetType.SINGLE_ENEMY:
-            alive = [e for e in combat.enemies if not e.is_dead]
-            targets = [alive[0]] if alive else []
-            msgs = apply_ability(char.name, ability, targets, False, s, self._ctx)
-            if alive:
-                self._spawn_spell_effects(0, True, dmg_type_str)
-        elif ability.target == TargetType.ALL_ENEMIES:
-            targets = [e for e in combat.enemies if not e.is_dead]
-            msgs = apply_ability(char.name, ability, targets, False, s, self._ctx)
-            for i in range(len(targets)):
-                self._spawn_spell_effects(i, True, dmg_type_str)
-        elif ability.target == TargetType.SINGLE_ALLY:
-            alive = [c for c in s.party if not c.is_dead]
-            target = min(alive, key=lambda c: c.current_hp / max(1, c.max_hp)) if alive else None
-            msgs = apply_ability(char.name, ability, [target] if target else [], True, s, self._ctx)
-            if target and ability.effect == AbilityEffect.HEAL:
-                idx = next((i for i, c in enumerate(s.party) if c.name == target.name and not c.is_dead), 0)
-                self._spawn_heal_effects(idx, False)
-            elif target:
-                idx = next((i for i, c in enumerate(s.party) if c.name == target.name and not c.is_dead), 0)
-                self._spawn_buff_effects(idx, False)
-        elif ability.target == TargetType.ALL_ALLIES:
-            targets = [c for c in s.party if not c.is_dead]
-            msgs = apply_ability(char.name, ability, targets, True, s, self._ctx)
-            for i in range(len(targets)):
-                if ability.effect == AbilityEffect.HEAL:
-                    self._spawn_heal_effects(i, False)
-                else:
-                    self._spawn_buff_effects(i, False)
-        elif ability.target == TargetType.SELF:
-            msgs = apply_ability(char.name, ability, [char], True, s, self._ctx)
-            idx = next((i for i, c in enumerate(s.party) if c.name == char.name), 0)
+        combat.combat_log.extend(msgs)
+        combat.phase = CombatPhase.RESOLVING
+        self._resolve_delay = 0.0
+
+    # -- Ability targeting (one handler per TargetType) --
+
+    def _cast_single_enemy(self, s: DungeonQuestState, char: Character, ability: AbilityDef) -> list[str]:
+        alive = [e for e in s.combat.enemies if not e.is_dead]
+        targets = [alive[0]] if alive else []
+        msgs = apply_ability(char.name, ability, targets, False, s, self._ctx)
+        if alive:
+            self._spawn_spell_effects(0, True, ability.damage_type.name)
+        return msgs
+
+    def _cast_all_enemies(self, s: DungeonQuestState, char: Character, ability: AbilityDef) -> list[str]:
+        targets = [e for e in s.combat.enemies if not e.is_dead]
+        msgs = apply_ability(char.name, ability, targets, False, s, self._ctx)
+        self._spawn_spell_effects_many(len(targets), True, ability.damage_type.name)
+        return msgs
+
+    def _cast_single_ally(self, s: DungeonQuestState, char: Character, ability: AbilityDef) -> list[str]:
+        alive = [c for c in s.party if not c.is_dead]
+        target = self._lowest_hp_ratio(alive)
+        msgs = apply_ability(char.name, ability, [target] if target else [], True, s, self._ctx)
+        if target:
+            idx = next((i for i, c in enumerate(s.party) if c.name == target.name and not c.is_dead), 0)
             if ability.effect == AbilityEffect.HEAL:
                 self._spawn_heal_effects(idx, False)
             else:
                 self._spawn_buff_effects(idx, False)
+        return msgs
+
+    def _cast_all_allies(self, s: DungeonQuestState, char: Character, ability: AbilityDef) -> list[str]:
+        targets = [c for c in s.party if not c.is_dead]
+        msgs = apply_ability(char.name, ability, targets, True, s, self._ctx)
+        if ability.effect == AbilityEffect.HEAL:
+            self._spawn_heal_effects_many(len(targets), False)
+        else:
+            self._spawn_buff_effects_many(len(targets), False)
+        return msgs
+
+    def _cast_self(self, s: DungeonQuestState, char: Character, ability: AbilityDef) -> list[str]:
+        msgs = apply_ability(char.name, ability, [char], True, s, self._ctx)
+        idx = next((i for i, c in enumerate(s.party) if c.name == char.name), 0)
+        if ability.effect == AbilityEffect.HEAL:
+            self._spawn_heal_effects(idx, False)
         else:
-            msgs = []
+            self._spawn_buff_effects(idx, False)
+        return msgs
 
-        combat.combat_log.extend(msgs)
-        combat.phase = CombatPhase.RESOLVING
-        self._resolve_delay = 0.0
+    _TARGET_HANDLERS = {
+        TargetType.SINGLE_ENEMY: _cast_single_enemy,
+        TargetType.ALL_ENEMIES: _cast_all_enemies,
+        TargetType.SINGLE_ALLY: _cast_single_ally,
+        TargetType.ALL_ALLIES: _cast_all_allies,
+        TargetType.SELF: _cast_self,
+    }
 
     def _use_combat_item(self, s: DungeonQuestState) -> None:
         combat = s.combat
         usable = self._usable_items(s)
         if not usable:
             return
-        item_id = usable[combat.item_cursor % len(usable)]
-        item = self._ctx.items[item_id]
+        item_id, item = usable[combat.item_cursor % len(usable)]
 
         # Use on current actor
         char = self._find_char(s, combat.current_actor)
@@ -554,14 +646,12 @@ class CombatScene(BaseScene):
             msgs = apply_ability(enemy.name, ability, targets, isinstance(targets[0], Enemy), s, self._ctx)
             combat.combat_log.extend(msgs)
             # Spawn spell effects on targets
-            dmg_type = getattr(ability, "damage_type", DamageType.PHYSICAL)
-            dmg_type_str = dmg_type.name if dmg_type else "PHYSICAL"
+            dmg_type_str = ability.damage_type.name
             is_ally_target = isinstance(targets[0], Enemy)
-            for i in range(len(targets)):
-                if ability.effect == AbilityEffect.HEAL:
-                    self._spawn_heal_effects(i, is_ally_target)
-                else:
-                    self._spawn_spell_effects(i, not is_ally_target, dmg_type_str)
+            if ability.effect == AbilityEffect.HEAL:
+                self._spawn_heal_effects_many(len(targets), is_ally_target)
+            else:
+                self._spawn_spell_effects_many(len(targets), not is_ally_target, dmg_type_str)
         elif action_type == "attack" and target:
             char = target
             old_hp = char.current_hp
@@ -623,7 +713,6 @@ class CombatScene(BaseScene):
                 char.buffs.clear()
             self._engine.scene_manager.pop(s)
         elif s.combat.phase == CombatPhase.DEFEAT:
-            from .game_over import GameOverScene
             scene = GameOverScene(self._engine, self._ctx, victory=False)
             self._engine.scene_manager.clear(s)
             self._engine.scene_manager.push(scene, s)
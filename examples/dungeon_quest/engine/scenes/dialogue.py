@@ -15,17 +15,20 @@ from ..dialogue.runner import (
     start_dialogue,
 )
 from ..rendering import colors, fonts
+from ..rendering.frame_cache import FrameCache
 from ..rendering.layout import Layout
 from ..rendering.panels import draw_panel
-from ..rendering.text import draw_text, draw_typewriter
+from ..rendering.text import TypewriterText
 from ..rendering.menu_renderer import draw_menu
 from ..state import DungeonQuestState
+from .combat import CombatScene
 
 if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
 TYPEWRITER_SPEED = 30.0  # chars per second
+CONTINUE_TEXT = "[Enter] to continue"
 
 
 class DialogueScene(BaseScene):
@@ -38,16 +41,34 @@ class DialogueScene(BaseScene):
         self._layout: Layout | None = None
         self._pending_encounter: str | None = None
         self._notification = ""
+        self._frame = FrameCache()
+        self._overlay: pygame.Surface | None = None
+        self._typewriter: TypewriterText | None = None
+        self._hint_surf: pygame.Surface | None = None
+        self._hint_pos = (0, 0)
+        self._menu_cache: tuple[tuple[tuple[str, ...], int, tuple[int, int]], pygame.Surface] | None = None
 
     def on_enter(self, state: BaseGameState) -> None:
         s = self._cast(state)
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            # Uniform surface alpha blends faster than a per-pixel SRCALPHA overlay
+            self._overlay = pygame.Surface((window.width, window.height))
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(180)
+        self._font_small = fonts.small()
+        self._hint_surf = self._font_small.render(CONTINUE_TEXT, True, colors.LIGHT_GRAY)
+        if self._layout:
+            self._hint_pos = (self._layout.width // 2 - self._hint_surf.get_width() // 2, self._layout.height - 30)
+        self._font_normal = fonts.normal()
+        self._font_large = fonts.large()
         start_dialogue(self._dialogue_id, s, self._ctx)
+        self._frame.invalidate()
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         s = self._cast(state)
+        self._frame.invalidate()
         node = get_current_node(s, self._ctx)
         if not node:
             self._close(s)
@@ -91,12 +112,25 @@ class DialogueScene(BaseScene):
             return
 
         if not s.dialogue.typewriter_done:
+            shown = int(s.dialogue.typewriter_progress)
             s.dialogue.typewriter_progress += TYPEWRITER_SPEED * dt
             if s.dialogue.typewriter_progress >= len(node.text):
                 s.dialogue.typewriter_done = True
+                self._frame.invalidate()
+            elif int(s.dialogue.typewriter_progress) != shown:
+                self._frame.invalidate()
+
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        # Keep the full frame rate while the typewriter is animating
+        return self._frame.dirty or not self._cast(state).dialogue.typewriter_done
 
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
-        s = self._cast(state)
+        if self._frame.blit(surface):
+            return
+        self._draw(surface, self._cast(state))
+        self._frame.store(surface)
+
+    def _draw(self, surface: pygame.Surface, s: DungeonQuestState) -> None:
         if not self._layout:
             return
 
@@ -105,26 +139,24 @@ class DialogueScene(BaseScene):
             return
 
         # Dark backdrop
-        overlay = pygame.Surface((self._layout.width, self._layout.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        if self._overlay:
+            surface.blit(self._overlay, (0, 0))
 
         # Speaker name
         speaker_rect = self._layout.dialogue_speaker()
-        font_large = fonts.large()
-        speaker_surf = font_large.render(node.speaker, True, colors.YELLOW)
+        speaker_surf = self._font_large.render(node.speaker, True, colors.YELLOW)
         surface.blit(speaker_surf, (speaker_rect.x + 10, speaker_rect.y))
 
         # Dialogue text with typewriter
         text_rect = self._layout.dialogue_text()
         inner = draw_panel(surface, text_rect)
+        if self._typewriter is None or self._typewriter.text != node.text:
+            self._typewriter = TypewriterText(node.text, inner, colors.WHITE, self._font_normal)
         if s.dialogue.typewriter_done:
-            draw_text(surface, node.text, inner, colors.WHITE, fonts.normal())
+            chars = len(node.text)
         else:
-            draw_typewriter(
-                surface, node.text, inner, s.dialogue.typewriter_progress / max(1, len(node.text)),
-                colors.WHITE, fonts.normal(),
-            )
+            chars = int(s.dialogue.typewriter_progress / max(1, len(node.text)) * len(node.text))
+        self._typewriter.draw(surface, inner.topleft, chars)
 
         # Choices
         if s.dialogue.typewriter_done:
@@ -132,24 +164,33 @@ class DialogueScene(BaseScene):
             if choices:
                 choice_rect = self._layout.dialogue_choices()
                 inner = draw_panel(surface, choice_rect)
-                items = [text for _, text in choices]
-                draw_menu(surface, inner, items, s.dialogue.choice_cursor)
-            else:
-                prompt = fonts.small().render("[Enter] to continue", True, colors.LIGHT_GRAY)
-                surface.blit(prompt, (self._layout.width // 2 - prompt.get_width() // 2, self._layout.height - 30))
+                items = tuple(text for _, text in choices)
+                surface.blit(self._menu_surface(items, s.dialogue.choice_cursor, inner.size), inner.topleft)
+            elif self._hint_surf:
+                surface.blit(self._hint_surf, self._hint_pos)
 
         # Notification
         if self._notification:
-            notif = fonts.normal().render(self._notification, True, colors.HEAL_COLOR)
+            notif = self._font_normal.render(self._notification, True, colors.HEAL_COLOR)
             surface.blit(notif, (self._layout.width // 2 - notif.get_width() // 2, self._layout.height // 3))
 
+    def _menu_surface(
+        self, items: tuple[str, ...], cursor: int, size: tuple[int, int]
+    ) -> pygame.Surface:
+        """Return the choice menu, re-rendered only when items or cursor change."""
+        key = (items, cursor, size)
+        if self._menu_cache is None or self._menu_cache[0] != key:
+            menu = pygame.Surface(size, pygame.SRCALPHA)
+            draw_menu(menu, menu.get_rect(), list(items), cursor)
+            self._menu_cache = (key, menu)
+        return self._menu_cache[1]
+
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
         return state
 
     def _close(self, s: DungeonQuestState) -> None:
         if self._pending_encounter:
-            from .combat import CombatScene
             enc_id = self._pending_encounter
             self._pending_encounter = None
             self._engine.scene_manager.pop(s)
@@ -16,17 +16,27 @@ from ..exploration.dungeon import (
 )
 from ..rendering import colors, fonts
 from ..rendering.layout import Layout
-from ..rendering.map_renderer import draw_dungeon
+from ..rendering.map_renderer import TILE_SIZE, draw_dungeon
 from ..rendering.panels import draw_panel
 from ..rendering.hud import draw_party_summary
 from ..rendering.text import draw_text
 from ..state import DungeonQuestState
 from ...content.types import TileType
+from .combat import CombatScene
+from .dialogue import DialogueScene
+from .inventory import InventoryScene
+from .party import PartyScene
 
 if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
+NOTIF_SECONDS = 2.0  # how long a notification stays on screen
+
+# Tiles the party can leave the dungeon from
+_EXIT_TILES = frozenset({TileType.ENTRANCE, TileType.STAIRS_UP})
+HINT_TEXT = "[WASD/Arrows] Move  [Esc] Exit  [I] Items  [P] Party"
+
 
 class DungeonScene(BaseScene):
     input_repeat_delay = 0.12
@@ -36,15 +46,27 @@ class DungeonScene(BaseScene):
         self._ctx = ctx
         self._layout: Layout | None = None
         self._notification = ""
-        self._notif_timer = 0.0
+        self._notif_deadline = 0.0
+        # Rendered map viewport, rebuilt only when the view changes
+        self._map_view: pygame.Surface | None = None
+        self._map_key: tuple | None = None
+        self._hint_surf: pygame.Surface | None = None
+        self._hint_pos = (0, 0)
+        self._dirty = True
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+        self._font_small = fonts.small()
+        self._hint_surf = self._font_small.render(HINT_TEXT, True, colors.LIGHT_GRAY)
+        if self._layout:
+            self._hint_pos = (self._layout.width // 2 - self._hint_surf.get_width() // 2, self._layout.height - 20)
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         s = self._cast(state)
+        self._dirty = True
 
         dx, dy = 0, 0
         if event.action in ("move_up", "w"):
@@ -58,16 +80,14 @@ class DungeonScene(BaseScene):
         elif event.action == "cancel":
             # Check if on entrance/stairs_up — exit dungeon
             tile = get_current_tile(s, self._ctx)
-            if tile in (TileType.ENTRANCE, TileType.STAIRS_UP):
+            if tile in _EXIT_TILES:
                 exit_dungeon(s)
                 self._engine.scene_manager.pop(s)
             return
         elif event.action == "inventory":
-            from .inventory import InventoryScene
             self._engine.scene_manager.push(InventoryScene(self._engine, self._ctx), s)
             return
         elif event.action == "party":
-            from .party import PartyScene
             self._engine.scene_manager.push(PartyScene(self._engine, self._ctx), s)
             return
 
@@ -77,41 +97,41 @@ class DungeonScene(BaseScene):
         enc_id, dlg_id, msg = move_player(dx, dy, s, self._ctx)
 
         if msg:
-            self._notification = msg
-            self._notif_timer = 2.0
+            self._notify(s, msg)
 
         # Check tile-based actions after movement
         tile = get_current_tile(s, self._ctx)
-        if tile == TileType.STAIRS_DOWN and not enc_id:
+        if tile is TileType.STAIRS_DOWN and not enc_id:
             err = go_deeper(s, self._ctx)
             if err:
-                self._notification = err
-                self._notif_timer = 2.0
+                self._notify(s, err)
             else:
                 # Refresh scene
                 level = self._ctx.dungeon_levels.get(s.exploration.dungeon_level_id or "")
                 if level:
-                    self._notification = f"Descended to {level.name}"
-                    self._notif_timer = 2.0
+                    self._notify(s, f"Descended to {level.name}")
 
         if enc_id:
-            from .combat import CombatScene
             scene = CombatScene(self._engine, self._ctx, enc_id)
             self._engine.scene_manager.push(scene, s)
 
         if dlg_id:
-            from .dialogue import DialogueScene
             scene = DialogueScene(self._engine, self._ctx, dlg_id)
             self._engine.scene_manager.push(scene, s)
 
     def update(self, dt: float, state: BaseGameState) -> None:
-        if self._notif_timer > 0:
-            self._notif_timer -= dt
-            if self._notif_timer <= 0:
-                self._notification = ""
+        pass
+
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty or self._notif_expired(state)
 
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
-        s = self._cast(state)
+        if self._notif_expired(state):
+            self._notification = ""
+        self._draw(surface, self._cast(state))
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, s: DungeonQuestState) -> None:
         if not self._layout:
             return
 
@@ -126,14 +146,27 @@ class DungeonScene(BaseScene):
         draw_panel(surface, map_rect, title=level.name)
         inner_map = map_rect.inflate(-8, -28)
         player_class = s.party[0].char_class.name if s.party else ""
-        draw_dungeon(
-            surface,
-            inner_map,
-            level.tiles,
-            s.exploration.player_x,
-            s.exploration.player_y,
-            player_class=player_class,
+        px, py = s.exploration.player_x, s.exploration.player_y
+        # The tiles and their closing grid line cover the view completely,
+        # so it can be an opaque surface trimmed to the grid
+        view_size = (
+            min(inner_map.width, inner_map.width // TILE_SIZE * TILE_SIZE + 1),
+            min(inner_map.height, inner_map.height // TILE_SIZE * TILE_SIZE + 1),
         )
+        map_key = (level_id, px, py, player_class, inner_map.size)
+        if self._map_view is None or map_key != self._map_key:
+            if self._map_view is None or self._map_view.get_size() != view_size:
+                self._map_view = pygame.Surface(view_size)
+            draw_dungeon(
+                self._map_view,
+                pygame.Rect((0, 0), inner_map.size),
+                level,
+                px,
+                py,
+                player_class=player_class,
+            )
+            self._map_key = map_key
+        surface.blit(self._map_view, inner_map.topleft)
 
         # HUD sidebar
         hud_rect = self._layout.dungeon_hud()
@@ -142,14 +175,20 @@ class DungeonScene(BaseScene):
 
         # Notification
         if self._notification:
-            font = fonts.small()
-            notif_surf = font.render(self._notification, True, colors.YELLOW)
+            notif_surf = self._font_small.render(self._notification, True, colors.YELLOW)
             x = map_rect.centerx - notif_surf.get_width() // 2
             surface.blit(notif_surf, (x, map_rect.bottom - 24))
 
         # Controls hint
-        hint = fonts.small().render("[WASD/Arrows] Move  [Esc] Exit  [I] Items  [P] Party", True, colors.LIGHT_GRAY)
-        surface.blit(hint, (self._layout.width // 2 - hint.get_width() // 2, self._layout.height - 20))
+        if self._hint_surf:
+            surface.blit(self._hint_surf, self._hint_pos)
+
+    def _notify(self, s: DungeonQuestState, message: str) -> None:
+        self._notification = message
+        self._notif_deadline = s.elapsed_time + NOTIF_SECONDS
+
+    def _notif_expired(self, state: BaseGameState) -> bool:
+        return bool(self._notification) and state.elapsed_time >= self._notif_deadline
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
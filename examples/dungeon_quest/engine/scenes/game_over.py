@@ -10,9 +10,8 @@ from ludos import BaseGameState, BaseScene, InputEvent
 
 from ..rendering import colors, fonts
 from ..rendering.layout import Layout
-from ..rendering.panels import draw_panel
-from ..rendering.text import draw_text
 from ..rendering.menu_renderer import draw_menu
+from ..rendering.text import draw_text
 from ..state import DungeonQuestState
 
 if TYPE_CHECKING:
@@ -20,6 +19,9 @@ if TYPE_CHECKING:
     from ..context import GameContext
 
 
+MENU_ITEMS = ("Title Screen", "Quit")
+
+
 class GameOverScene(BaseScene):
     input_repeat_delay = 0.15
 
@@ -29,21 +31,31 @@ class GameOverScene(BaseScene):
         self._victory = victory
         self._layout: Layout | None = None
         self._cursor = 0
+        self._dirty = True
+        self._built_message: str | None = None
+        self._title: tuple[pygame.Surface, pygame.Rect]
+        self._message_surf: tuple[pygame.Surface, tuple[int, int]]
+        # One rendered menu per cursor position
+        self._menu_surfs: list[pygame.Surface] = []
+        self._menu_pos: tuple[int, int] = (0, 0)
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            self._build_surfaces(self._message(self._cast(state)))
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         s = self._cast(state)
+        self._dirty = True
         if event.action == "move_up":
-            self._cursor = (self._cursor - 1) % 2
+            self._cursor = (self._cursor - 1) % len(MENU_ITEMS)
         elif event.action == "move_down":
-            self._cursor = (self._cursor + 1) % 2
+            self._cursor = (self._cursor + 1) % len(MENU_ITEMS)
         elif event.action == "confirm":
             if self._cursor == 0:  # Retry / Title
-                from .title import TitleScene
+                from .title import TitleScene  # deferred: title imports this module indirectly
                 self._engine.scene_manager.clear(s)
                 scene = TitleScene(self._engine, self._ctx)
                 self._engine.scene_manager.push(scene, s)
@@ -53,40 +65,68 @@ class GameOverScene(BaseScene):
     def update(self, dt: float, state: BaseGameState) -> None:
         pass
 
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty
+
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
-        s = self._cast(state)
+        self._draw(surface, self._cast(state))
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, s: DungeonQuestState) -> None:
         if not self._layout:
             return
 
+        message = self._message(s)
+        if message != self._built_message:
+            self._build_surfaces(message)
+
+        surface.blit(*self._title)
+        surface.blit(*self._message_surf)
+        surface.blit(self._menu_surfs[self._cursor], self._menu_pos)
+
+    def _message(self, s: DungeonQuestState) -> str:
+        if self._victory:
+            return s.victory_text or self._ctx.quest_pack.victory_text
+        return "Your party has fallen..."
+
+    def _build_surfaces(self, message: str) -> None:
+        """Rasterize the title, message and menu items once."""
+        assert self._layout is not None
+        layout = self._layout
         if self._victory:
             title = "VICTORY!"
             title_color = colors.YELLOW
-            message = s.victory_text or self._ctx.quest_pack.victory_text
         else:
             title = "GAME OVER"
             title_color = colors.HP_RED
-            message = "Your party has fallen..."
 
         # Title
-        title_font = fonts.title()
-        title_surf = title_font.render(title, True, title_color)
-        title_rect = title_surf.get_rect(center=(self._layout.width // 2, self._layout.height // 4))
-        surface.blit(title_surf, title_rect)
+        title_surf = fonts.title().render(title, True, title_color)
+        title_rect = title_surf.get_rect(center=(layout.width // 2, layout.height // 4))
+        self._title = (title_surf, title_rect)
 
         # Message
         msg_rect = pygame.Rect(
-            self._layout.width // 4,
-            self._layout.height // 3,
-            self._layout.width // 2,
-            self._layout.height // 4,
+            layout.width // 4,
+            layout.height // 3,
+            layout.width // 2,
+            layout.height // 4,
         )
-        draw_text(surface, message, msg_rect, colors.WHITE, fonts.normal())
+        msg_surf = pygame.Surface(msg_rect.size, pygame.SRCALPHA)
+        draw_text(msg_surf, message, msg_surf.get_rect(), colors.WHITE, fonts.normal())
+        self._message_surf = (msg_surf, msg_rect.topleft)
 
         # Menu
-        menu_rect = self._layout.centered(200, 80)
-        menu_rect.y = self._layout.height * 2 // 3
-        items = ["Title Screen", "Quit"]
-        draw_menu(surface, menu_rect, items, self._cursor, font=fonts.large())
+        menu_rect = layout.centered(200, 80)
+        menu_rect.y = layout.height * 2 // 3
+        self._menu_surfs = []
+        for cursor in range(len(MENU_ITEMS)):
+            menu = pygame.Surface(menu_rect.size, pygame.SRCALPHA)
+            draw_menu(menu, menu.get_rect(), MENU_ITEMS, cursor, font=fonts.large())
+            self._menu_surfs.append(menu)
+        self._menu_pos = menu_rect.topleft
+
+        self._built_message = message
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import pygame
@@ -14,13 +15,16 @@ from ..rendering.layout import Layout
 from ..rendering.panels import draw_panel
 from ..rendering.text import draw_text
 from ..rendering.menu_renderer import draw_menu
-from ..state import DungeonQuestState
-from ...content.types import ItemType
+from ..state import Character, DungeonQuestState
+from ...content.types import ItemDef, ItemType
 
 if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
+NOTIF_SECONDS = 2.0  # how long a notification stays on screen
+HINT_TEXT = "[Enter] Use/Equip  [Esc] Close"
+
 
 class InventoryScene(BaseScene):
     input_repeat_delay = 0.15
@@ -33,20 +37,41 @@ class InventoryScene(BaseScene):
         self._char_cursor = 0  # For equip target
         self._mode = "list"  # "list" or "equip_target"
         self._notification = ""
-        self._notif_timer = 0.0
+        self._notif_deadline = 0.0
+        self._dirty = True
+        self._overlay: pygame.Surface | None = None
+        self._hint_surf: pygame.Surface | None = None
+        self._hint_pos = (0, 0)
+        self._items_cache: list[tuple[str, int]] | None = None
+        self._alive_cache: list[Character] | None = None
+        self._detail_cache: dict[str, pygame.Surface] = {}
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            # Uniform surface alpha blends faster than a per-pixel SRCALPHA overlay
+            self._overlay = pygame.Surface((window.width, window.height))
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(180)
+        self._font_small = fonts.small()
+        self._hint_surf = self._font_small.render(HINT_TEXT, True, colors.LIGHT_GRAY)
+        if self._layout:
+            panel = self._layout.centered(500, 400)
+            self._hint_pos = (panel.centerx - self._hint_surf.get_width() // 2, panel.bottom + 4)
+        self._font_normal = fonts.normal()
         self._cursor = 0
         self._mode = "list"
+        self._items_cache = None
+        self._alive_cache = None
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         s = self._cast(state)
+        self._dirty = True
 
         if self._mode == "equip_target":
-            alive = [c for c in s.party if not c.is_dead]
+            alive = self._alive(s)
             if event.action == "move_up":
                 self._char_cursor = (self._char_cursor - 1) % max(1, len(alive))
             elif event.action == "move_down":
@@ -68,20 +93,24 @@ class InventoryScene(BaseScene):
             self._engine.scene_manager.pop(s)
 
     def update(self, dt: float, state: BaseGameState) -> None:
-        if self._notif_timer > 0:
-            self._notif_timer -= dt
-            if self._notif_timer <= 0:
-                self._notification = ""
+        pass
+
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty or self._notif_expired(state)
 
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
-        s = self._cast(state)
+        if self._notif_expired(state):
+            self._notification = ""
+        self._draw(surface, self._cast(state))
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, s: DungeonQuestState) -> None:
         if not self._layout:
             return
 
         # Semi-transparent backdrop
-        overlay = pygame.Surface((self._layout.width, self._layout.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        if self._overlay:
+            surface.blit(self._overlay, (0, 0))
 
         panel = self._layout.centered(500, 400)
         inner = draw_panel(surface, panel, title=f"Inventory (Gold: {s.gold})")
@@ -106,73 +135,89 @@ class InventoryScene(BaseScene):
                 item_id = items[self._cursor][0]
                 item = self._ctx.items.get(item_id)
                 if item:
-                    y = detail_rect.y
-                    font = fonts.normal()
-                    small = fonts.small()
-
-                    name_surf = font.render(item.name, True, colors.YELLOW)
-                    surface.blit(name_surf, (detail_rect.x, y))
-                    y += 28
-
-                    draw_text(surface, item.description, pygame.Rect(detail_rect.x, y, detail_rect.width, 60), colors.LIGHT_GRAY, small)
-                    y += 65
-
-                    type_surf = small.render(f"Type: {item.item_type.name}", True, colors.WHITE)
-                    surface.blit(type_surf, (detail_rect.x, y))
-                    y += 20
-
-                    if item.item_type == ItemType.EQUIPMENT and item.slot:
-                        slot_surf = small.render(f"Slot: {item.slot.name}", True, colors.WHITE)
-                        surface.blit(slot_surf, (detail_rect.x, y))
-                        y += 20
-                        if item.attack_bonus:
-                            surface.blit(small.render(f"ATK +{item.attack_bonus}", True, colors.BUFF_COLOR), (detail_rect.x, y))
-                            y += 18
-                        if item.defense_bonus:
-                            surface.blit(small.render(f"DEF +{item.defense_bonus}", True, colors.BUFF_COLOR), (detail_rect.x, y))
-                            y += 18
-
-                    elif item.item_type == ItemType.CONSUMABLE:
-                        if item.heal_amount:
-                            surface.blit(small.render(f"Heals {item.heal_amount} HP", True, colors.HEAL_COLOR), (detail_rect.x, y))
-                            y += 18
-                        if item.mp_restore:
-                            surface.blit(small.render(f"Restores {item.mp_restore} MP", True, colors.MP_BLUE), (detail_rect.x, y))
-                            y += 18
+                    detail = self._detail_cache.get(item_id)
+                    if detail is None or detail.get_size() != detail_rect.size:
+                        detail = self._render_detail(item, detail_rect.size)
+                        self._detail_cache[item_id] = detail
+                    surface.blit(detail, detail_rect.topleft)
 
         # Equip target selection
         if self._mode == "equip_target":
-            alive = [c for c in s.party if not c.is_dead]
+            alive = self._alive(s)
             char_panel = self._layout.centered(250, 200)
             char_panel.x += 200
             char_inner = draw_panel(surface, char_panel, title="Equip to:")
             char_names = [c.name for c in alive]
             draw_menu(surface, char_inner, char_names, self._char_cursor)
 
-        # Notification
+        # Controls, plus notification if any
+        blits = [(self._hint_surf, self._hint_pos)] if self._hint_surf else []
         if self._notification:
-            notif = fonts.small().render(self._notification, True, colors.YELLOW)
-            surface.blit(notif, (panel.centerx - notif.get_width() // 2, panel.bottom - 24))
+            notif = self._font_small.render(self._notification, True, colors.YELLOW)
+            blits.append((notif, (panel.centerx - notif.get_width() // 2, panel.bottom - 24)))
+        surface.blits(blits, doreturn=False)
+
+    def _notify(self, s: DungeonQuestState, message: str) -> None:
+        self._notification = message
+        self._notif_deadline = s.elapsed_time + NOTIF_SECONDS
 
-        # Controls
-        controls = "[Enter] Use/Equip  [Esc] Close"
-        hint = fonts.small().render(controls, True, colors.LIGHT_GRAY)
-        surface.blit(hint, (panel.centerx - hint.get_width() // 2, panel.bottom + 4))
+    def _notif_expired(self, state: BaseGameState) -> bool:
+        return bool(self._notification) and state.elapsed_time >= self._notif_deadline
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
         return state
 
+    def _render_detail(self, item: ItemDef, size: tuple[int, int]) -> pygame.Surface:
+        """Rasterize the detail pane for one item."""
+        detail = pygame.Surface(size, pygame.SRCALPHA)
+        font = self._font_normal
+        small = self._font_small
+        y = 0
+
+        blits = [(font.render(item.name, True, colors.YELLOW), (0, y))]
+        y += 28
+
+        draw_text(detail, item.description, pygame.Rect(0, y, size[0], 60), colors.LIGHT_GRAY, small)
+        y += 65
+
+        blits.append((small.render(f"Type: {item.item_type.name}", True, colors.WHITE), (0, y)))
+        y += 20
+
+        if item.item_type == ItemType.EQUIPMENT and item.slot:
+            blits.append((small.render(f"Slot: {item.slot.name}", True, colors.WHITE), (0, y)))
+            y += 20
+            if item.attack_bonus:
+                blits.append((small.render(f"ATK +{item.attack_bonus}", True, colors.BUFF_COLOR), (0, y)))
+                y += 18
+            if item.defense_bonus:
+                blits.append((small.render(f"DEF +{item.defense_bonus}", True, colors.BUFF_COLOR), (0, y)))
+                y += 18
+
+        elif item.item_type == ItemType.CONSUMABLE:
+            if item.heal_amount:
+                blits.append((small.render(f"Heals {item.heal_amount} HP", True, colors.HEAL_COLOR), (0, y)))
+                y += 18
+            if item.mp_restore:
+                blits.append((small.render(f"Restores {item.mp_restore} MP", True, colors.MP_BLUE), (0, y)))
+                y += 18
+
+        detail.blits(blits, doreturn=False)
+        return detail
+
     def _unique_items(self, s: DungeonQuestState) -> list[tuple[str, int]]:
-        """Get unique items with counts."""
-        counts: dict[str, int] = {}
-        order: list[str] = []
-        for item_id in s.inventory:
-            if item_id not in counts:
-                order.append(item_id)
-                counts[item_id] = 0
-            counts[item_id] += 1
-        return [(iid, counts[iid]) for iid in order]
+        """Get unique items with counts (cached until the inventory changes here)."""
+        if self._items_cache is not None:
+            return self._items_cache
+        # Counter keeps first-seen order, matching inventory order
+        self._items_cache = list(Counter(s.inventory).items())
+        return self._items_cache
+
+    def _alive(self, s: DungeonQuestState) -> list[Character]:
+        """Living party members (cached; only consumables here can change HP)."""
+        if self._alive_cache is None:
+            self._alive_cache = [c for c in s.party if not c.is_dead]
+        return self._alive_cache
 
     def _use_item(self, s: DungeonQuestState) -> None:
         items = self._unique_items(s)
@@ -185,15 +230,16 @@ class InventoryScene(BaseScene):
 
         if item.item_type == ItemType.CONSUMABLE:
             # Use on first alive party member
-            alive = [c for c in s.party if not c.is_dead]
+            alive = self._alive(s)
             if alive:
                 msg = use_consumable(alive[0], item_id, s, self._ctx)
+                self._items_cache = None
+                self._alive_cache = None
                 if msg:
-                    self._notification = msg
-                    self._notif_timer = 2.0
+                    self._notify(s, msg)
 
         elif item.item_type == ItemType.EQUIPMENT:
-            alive = [c for c in s.party if not c.is_dead]
+            alive = self._alive(s)
             if alive:
                 self._mode = "equip_target"
                 self._char_cursor = 0
@@ -204,13 +250,13 @@ class InventoryScene(BaseScene):
             self._mode = "list"
             return
         item_id = items[self._cursor][0]
-        alive = [c for c in s.party if not c.is_dead]
+        alive = self._alive(s)
         if self._char_cursor >= len(alive):
             self._mode = "list"
             return
         char = alive[self._char_cursor]
         msg = equip_item(char, item_id, s, self._ctx)
+        self._items_cache = None
         if msg:
-            self._notification = msg
-            self._notif_timer = 2.0
+            self._notify(s, msg)
         self._mode = "list"
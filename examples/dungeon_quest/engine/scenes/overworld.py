@@ -8,7 +8,7 @@ import pygame
 
 from ludos import BaseGameState, BaseScene, InputEvent
 
-from ..exploration.overworld import get_area_actions, travel_to_area, get_locked_text
+from ..exploration.overworld import get_area_actions, travel_to_area
 from ..exploration.dungeon import enter_dungeon
 from ..quests.tracker import update_quests
 from ..rendering import colors, fonts
@@ -18,6 +18,14 @@ from ..rendering.text import draw_text
 from ..rendering.menu_renderer import draw_menu
 from ..rendering.sprites import SpriteCache
 from ..state import DungeonQuestState
+from ..types import ActionKind
+from ...content.types import AreaConnection
+from .dialogue import DialogueScene
+from .dungeon import DungeonScene
+from .game_over import GameOverScene
+from .inventory import InventoryScene
+from .party import PartyScene
+from .rest import RestScene
 
 if TYPE_CHECKING:
     from ludos import GameEngine
@@ -32,6 +40,8 @@ class OverworldScene(BaseScene):
         self._ctx = ctx
         self._layout: Layout | None = None
         self._actions: list[str] = []
+        self._action_kinds: list[tuple[ActionKind, object]] = []  # (kind, payload) per action
+        self._disabled: frozenset[int] = frozenset()
         self._notification = ""
         self._notif_timer = 0.0
 
@@ -40,20 +50,19 @@ class OverworldScene(BaseScene):
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+        self._font_small = fonts.small()
+        self._font_normal = fonts.normal()
         self._rebuild_actions(s)
 
         # Update quests
-        quest_msgs = update_quests(s, self._ctx)
+        quest_msgs, victory = update_quests(s, self._ctx)
         if quest_msgs:
             self._notification = " | ".join(quest_msgs)
             self._notif_timer = 3.0
 
-        # Check victory condition
-        victory_flag = self._ctx.quest_pack.victory_flag
-        if victory_flag in s.quest.flags and not s.game_won:
+        if victory:
             s.game_won = True
             s.victory_text = self._ctx.quest_pack.victory_text
-            from .game_over import GameOverScene
             scene = GameOverScene(self._engine, self._ctx, victory=True)
             self._engine.scene_manager.replace(scene, s)
 
@@ -88,13 +97,17 @@ class OverworldScene(BaseScene):
         if not area:
             return
 
+        clip = surface.get_clip()
+
         # Handle intro overlay
         if s.show_intro:
             panel = self._layout.centered(500, 300)
             inner = draw_panel(surface, panel, title=self._ctx.quest_pack.name)
-            draw_text(surface, s.intro_text, inner, colors.WHITE, fonts.normal())
-            prompt = fonts.small().render("[Enter] to continue", True, colors.LIGHT_GRAY)
-            surface.blit(prompt, (panel.centerx - prompt.get_width() // 2, panel.bottom - 30))
+            draw_text(surface, s.intro_text, inner, colors.WHITE, self._font_normal)
+            prompt = self._font_small.render("[Enter] to continue", True, colors.LIGHT_GRAY)
+            prompt_rect = prompt.get_rect(midtop=(panel.centerx, panel.bottom - 30))
+            if clip.colliderect(prompt_rect):
+                surface.blit(prompt, prompt_rect)
             return
 
         # Description panel
@@ -109,27 +122,26 @@ class OverworldScene(BaseScene):
         vignette_h = vignette.get_height()
         vx = inner.x + (inner.width - vignette_w) // 2
         vy = inner.y
-        surface.blit(vignette, (vx, vy), (0, 0, vignette_w, vignette_h))
+        blits: list[tuple] = []
+        # Skip the blit outright when a small window leaves it no visible area
+        if vignette_w > 0 and vignette_h > 0 and clip.colliderect((vx, vy, vignette_w, vignette_h)):
+            blits.append((vignette, (vx, vy), (0, 0, vignette_w, vignette_h)))
 
         # Shift description text down below the vignette
         text_rect = pygame.Rect(inner.x, vy + vignette_h + 4, inner.width, inner.height - vignette_h - 4)
-        draw_text(surface, area.description, text_rect, colors.WHITE, fonts.normal())
+        draw_text(surface, area.description, text_rect, colors.WHITE, self._font_normal)
 
         # Notification
         if self._notification:
-            font = fonts.small()
-            notif_surf = font.render(self._notification, True, colors.YELLOW)
-            surface.blit(notif_surf, (inner.x, inner.bottom - 20))
+            notif_surf = self._font_small.render(self._notification, True, colors.YELLOW)
+            blits.append((notif_surf, (inner.x, inner.bottom - 20)))
+        if blits:
+            surface.blits(blits, doreturn=False)
 
         # Action menu
         action_rect = self._layout.overworld_actions()
         inner = draw_panel(surface, action_rect, title="Actions")
-        # Mark locked actions
-        disabled = set()
-        for i, action in enumerate(self._actions):
-            if action.startswith("Travel: [Locked]"):
-                disabled.add(i)
-        draw_menu(surface, inner, self._actions, s.exploration.overworld_cursor, disabled=disabled)
+        draw_menu(surface, inner, self._actions, s.exploration.overworld_cursor, disabled=self._disabled)
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
@@ -137,81 +149,56 @@ class OverworldScene(BaseScene):
 
     def _rebuild_actions(self, s: DungeonQuestState) -> None:
         area = self._ctx.areas.get(s.exploration.current_area_id)
-        if area:
-            self._actions = get_area_actions(area, s, self._ctx)
-        else:
-            self._actions = []
+        actions = get_area_actions(area, s, self._ctx) if area else []
+        self._actions = [label for label, _, _ in actions]
+        self._action_kinds = [(kind, payload) for _, kind, payload in actions]
+        # Locked travel actions are greyed out in the menu
+        self._disabled = frozenset(i for i, (kind, _) in enumerate(self._action_kinds) if kind is ActionKind.TRAVEL_LOCKED)
 
     def _select_action(self, s: DungeonQuestState) -> None:
         if not self._actions:
             return
-        action = self._actions[s.exploration.overworld_cursor]
-
-        if action.startswith("Travel: [Locked]"):
-            # Find locked text
-            area = self._ctx.areas.get(s.exploration.current_area_id)
-            if area:
-                conn_idx = 0
-                for i, a in enumerate(self._actions):
-                    if a == action:
-                        # Count travel actions up to this index
-                        for conn in area.connections:
-                            if conn_idx == i:
-                                self._notification = conn.locked_text
-                                self._notif_timer = 2.0
-                                break
-                            conn_idx += 1
-            return
+        kind, payload = self._action_kinds[s.exploration.overworld_cursor]
 
-        if action.startswith("Travel: "):
-            label = action[8:]
-            area = self._ctx.areas.get(s.exploration.current_area_id)
-            if area:
-                for conn in area.connections:
-                    if conn.label == label:
-                        err = travel_to_area(conn.target_area_id, s, self._ctx)
-                        if err:
-                            self._notification = err
-                            self._notif_timer = 2.0
-                        else:
-                            # Replace with new overworld scene
-                            scene = OverworldScene(self._engine, self._ctx)
-                            self._engine.scene_manager.replace(scene, s)
-                        return
-
-        elif action == "Enter Dungeon":
-            err = enter_dungeon(s.exploration.current_area_id, s, self._ctx)
-            if err:
-                self._notification = err
+        match kind:
+            case ActionKind.TRAVEL_LOCKED:
+                assert isinstance(payload, AreaConnection)
+                self._notification = payload.locked_text
                 self._notif_timer = 2.0
-            else:
-                from .dungeon import DungeonScene
-                scene = DungeonScene(self._engine, self._ctx)
+
+            case ActionKind.TRAVEL:
+                assert isinstance(payload, AreaConnection)
+                err = travel_to_area(payload.target_area_id, s, self._ctx)
+                if err:
+                    self._notification = err
+                    self._notif_timer = 2.0
+                else:
+                    # Replace with new overworld scene
+                    scene = OverworldScene(self._engine, self._ctx)
+                    self._engine.scene_manager.replace(scene, s)
+
+            case ActionKind.DUNGEON:
+                err = enter_dungeon(s.exploration.current_area_id, s, self._ctx)
+                if err:
+                    self._notification = err
+                    self._notif_timer = 2.0
+                else:
+                    scene = DungeonScene(self._engine, self._ctx)
+                    self._engine.scene_manager.push(scene, s)
+
+            case ActionKind.TALK:
+                assert isinstance(payload, str)
+                scene = DialogueScene(self._engine, self._ctx, payload)
+                self._engine.scene_manager.push(scene, s)
+
+            case ActionKind.REST:
+                scene = RestScene(self._engine, self._ctx)
+                self._engine.scene_manager.push(scene, s)
+
+            case ActionKind.PARTY:
+                scene = PartyScene(self._engine, self._ctx)
                 self._engine.scene_manager.push(scene, s)
 
-        elif action.startswith("Talk: "):
-            speaker = action[6:]
-            area = self._ctx.areas.get(s.exploration.current_area_id)
-            if area:
-                for dlg_id in area.npcs:
-                    dlg = self._ctx.dialogues.get(dlg_id)
-                    if dlg and dlg.nodes and dlg.nodes[0].speaker == speaker:
-                        from .dialogue import DialogueScene
-                        scene = DialogueScene(self._engine, self._ctx, dlg_id)
-                        self._engine.scene_manager.push(scene, s)
-                        return
-
-        elif action == "Rest":
-            from .rest import RestScene
-            scene = RestScene(self._engine, self._ctx)
-            self._engine.scene_manager.push(scene, s)
-
-        elif action == "Party":
-            from .party import PartyScene
-            scene = PartyScene(self._engine, self._ctx)
-            self._engine.scene_manager.push(scene, s)
-
-        elif action == "Inventory":
-            from .inventory import InventoryScene
-            scene = InventoryScene(self._engine, self._ctx)
-            self._engine.scene_manager.push(scene, s)
+            case ActionKind.INVENTORY:
+                scene = InventoryScene(self._engine, self._ctx)
+                self._engine.scene_manager.push(scene, s)
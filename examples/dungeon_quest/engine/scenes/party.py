@@ -2,23 +2,27 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import pygame
 
 from ludos import BaseGameState, BaseScene, InputEvent
 
-from ..characters.stats import effective_attack, effective_defense, effective_speed
+from ..characters.inventory import iter_equipment
+from ..characters.stats import effective_stats
 from ..rendering import colors, fonts
 from ..rendering.layout import Layout
 from ..rendering.panels import draw_panel
 from ..rendering.hud import draw_hp_bar, draw_mp_bar
-from ..state import DungeonQuestState
+from ..state import Character, DungeonQuestState
 
 if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
+CARD_CACHE_SIZE = 8
+
 
 class PartyScene(BaseScene):
     input_repeat_delay = 0.15
@@ -27,14 +31,24 @@ class PartyScene(BaseScene):
         self._engine = engine
         self._ctx = ctx
         self._layout: Layout | None = None
+        self._overlay: pygame.Surface | None = None
         self._cursor = 0
+        # Rendered card text, keyed by everything the text depends on (LRU)
+        self._card_cache: OrderedDict[tuple, list[tuple[pygame.Surface, tuple[int, int]]]] = OrderedDict()
+        self._dirty = True
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            # Uniform surface alpha blends faster than a per-pixel SRCALPHA overlay
+            self._overlay = pygame.Surface((window.width, window.height))
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(180)
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
+        self._dirty = True
         s = self._cast(state)
         if event.action == "move_left":
             self._cursor = (self._cursor - 1) % max(1, len(s.party))
@@ -46,47 +60,83 @@ class PartyScene(BaseScene):
     def update(self, dt: float, state: BaseGameState) -> None:
         pass
 
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty
+
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
+        self._draw(surface, state)
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, state: BaseGameState) -> None:
         s = self._cast(state)
         if not self._layout or not s.party:
             return
 
         # Backdrop
-        overlay = pygame.Surface((self._layout.width, self._layout.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        if self._overlay:
+            surface.blit(self._overlay, (0, 0))
 
         char = s.party[self._cursor % len(s.party)]
         panel = self._layout.centered(400, 420)
         class_name = char.char_class.name
         inner = draw_panel(surface, panel, title=f"{char.name} — {class_name}")
 
+        # Bars change with HP/MP; hud keeps its own per-value bar cache
+        draw_hp_bar(surface, inner.x + 30, inner.y + 30, 180, char.current_hp, char.max_hp)
+        draw_mp_bar(surface, inner.x + 30, inner.y + 50, 180, char.current_mp, char.max_mp)
+
+        atk, dfn, spd = effective_stats(char, self._ctx)
+        key = (
+            self._cursor,
+            len(s.party),
+            char.name,
+            char.level,
+            char.xp,
+            char.xp_to_next,
+            (atk, char.base_attack),
+            (dfn, char.base_defense),
+            (spd, char.base_speed),
+            iter_equipment(char),
+            char.visible_abilities,
+        )
+        card = self._card_cache.get(key)
+        if card is None:
+            card = self._render_card(char, atk, dfn, spd, len(s.party), panel, inner)
+            self._card_cache[key] = card
+            if len(self._card_cache) > CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+        else:
+            self._card_cache.move_to_end(key)
+        surface.blits([(surf, (inner.x + dx, inner.y + dy)) for surf, (dx, dy) in card], doreturn=False)
+
+    def _render_card(
+        self,
+        char: Character,
+        atk: int,
+        dfn: int,
+        spd: int,
+        party_size: int,
+        panel: pygame.Rect,
+        inner: pygame.Rect,
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Render the text of a character card, positioned relative to *inner*."""
         font = fonts.normal()
         small = fonts.small()
-        y = inner.y
+        y = 0
+        card: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
         # Level + XP
-        lvl_surf = font.render(f"Level {char.level}  XP: {char.xp}/{char.level * 100 + 100}", True, colors.WHITE)
-        surface.blit(lvl_surf, (inner.x, y))
+        lvl_surf = font.render(f"Level {char.level}  XP: {char.xp}/{char.xp_to_next}", True, colors.WHITE)
+        card.append((lvl_surf, (0, y)))
         y += 30
 
-        # HP bar
-        hp_label = small.render("HP", True, colors.WHITE)
-        surface.blit(hp_label, (inner.x, y + 1))
-        draw_hp_bar(surface, inner.x + 30, y, 180, char.current_hp, char.max_hp)
+        # HP / MP labels (bars are drawn by render)
+        card.append((small.render("HP", True, colors.WHITE), (0, y + 1)))
         y += 20
-
-        # MP bar
-        mp_label = small.render("MP", True, colors.WHITE)
-        surface.blit(mp_label, (inner.x, y + 1))
-        draw_mp_bar(surface, inner.x + 30, y, 180, char.current_mp, char.max_mp)
+        card.append((small.render("MP", True, colors.WHITE), (0, y + 1)))
         y += 28
 
         # Stats
-        atk = effective_attack(char, self._ctx)
-        dfn = effective_defense(char, self._ctx)
-        spd = effective_speed(char, self._ctx)
-
         stats = [
             ("ATK", atk, char.base_attack),
             ("DEF", dfn, char.base_defense),
@@ -95,40 +145,42 @@ class PartyScene(BaseScene):
         for label, eff, base in stats:
             color = colors.BUFF_COLOR if eff > base else colors.WHITE
             stat_surf = small.render(f"{label}: {eff} (base {base})", True, color)
-            surface.blit(stat_surf, (inner.x, y))
+            card.append((stat_surf, (0, y)))
             y += 20
 
         y += 10
 
         # Equipment
         equip_label = font.render("Equipment", True, colors.YELLOW)
-        surface.blit(equip_label, (inner.x, y))
+        card.append((equip_label, (0, y)))
         y += 26
-        for slot, item_id in char.equipment.items():
+        for slot, item_id in iter_equipment(char):
             if item_id and item_id in self._ctx.items:
                 item = self._ctx.items[item_id]
                 eq_surf = small.render(f"  {slot.name}: {item.name}", True, colors.WHITE)
             else:
                 eq_surf = small.render(f"  {slot.name}: (empty)", True, colors.DISABLED_COLOR)
-            surface.blit(eq_surf, (inner.x, y))
+            card.append((eq_surf, (0, y)))
             y += 18
 
         y += 10
 
         # Abilities
-        if char.abilities:
+        if char.visible_abilities:
             ab_label = font.render("Abilities", True, colors.YELLOW)
-            surface.blit(ab_label, (inner.x, y))
+            card.append((ab_label, (0, y)))
             y += 26
-            for ability in char.abilities[:5]:
+            for ability in char.visible_abilities:
                 ab_surf = small.render(f"  {ability.name} ({ability.cost}MP) - {ability.description}", True, colors.LIGHT_GRAY)
-                surface.blit(ab_surf, (inner.x, y))
+                card.append((ab_surf, (0, y)))
                 y += 18
 
         # Navigation hint
-        nav = f"< {self._cursor + 1}/{len(s.party)} >  [Left/Right] Switch  [Esc] Close"
-        hint = fonts.small().render(nav, True, colors.LIGHT_GRAY)
-        surface.blit(hint, (panel.centerx - hint.get_width() // 2, panel.bottom + 4))
+        nav = f"< {self._cursor + 1}/{party_size} >  [Left/Right] Switch  [Esc] Close"
+        hint = small.render(nav, True, colors.LIGHT_GRAY)
+        hint_pos = (panel.centerx - hint.get_width() // 2, panel.bottom + 4)
+        card.append((hint, (hint_pos[0] - inner.x, hint_pos[1] - inner.y)))
+        return card
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
+MENU_ITEMS = ("Rest", "Cancel")
+
 
 class RestScene(BaseScene):
     input_repeat_delay = 0.15
@@ -27,17 +29,27 @@ class RestScene(BaseScene):
         self._engine = engine
         self._ctx = ctx
         self._layout: Layout | None = None
+        self._overlay: pygame.Surface | None = None
         self._cursor = 0
         self._rested = False
+        # Rendered panel per (rested, cursor) state
+        self._panel_cache: dict[tuple[bool, int], pygame.Surface] = {}
+        self._dirty = True
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
+            # Uniform surface alpha blends faster than a per-pixel SRCALPHA overlay
+            self._overlay = pygame.Surface((window.width, window.height))
+            self._overlay.fill((0, 0, 0))
+            self._overlay.set_alpha(180)
         self._cursor = 0
         self._rested = False
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
+        self._dirty = True
         s = self._cast(state)
 
         if self._rested:
@@ -46,15 +58,14 @@ class RestScene(BaseScene):
             return
 
         if event.action == "move_up":
-            self._cursor = (self._cursor - 1) % 2
+            self._cursor = (self._cursor - 1) % len(MENU_ITEMS)
         elif event.action == "move_down":
-            self._cursor = (self._cursor + 1) % 2
+            self._cursor = (self._cursor + 1) % len(MENU_ITEMS)
         elif event.action == "confirm":
             if self._cursor == 0:  # Rest
                 for char in s.party:
                     if not char.is_dead:
-                        char.current_hp = char.max_hp
-                        char.current_mp = char.max_mp
+                        char.current_hp, char.current_mp = char.max_hp, char.max_mp
                 self._rested = True
             else:  # Cancel
                 self._engine.scene_manager.pop(s)
@@ -64,25 +75,43 @@ class RestScene(BaseScene):
     def update(self, dt: float, state: BaseGameState) -> None:
         pass
 
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty
+
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
+        self._draw(surface, state)
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, state: BaseGameState) -> None:
         if not self._layout:
             return
 
-        overlay = pygame.Surface((self._layout.width, self._layout.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        if self._overlay:
+            surface.blit(self._overlay, (0, 0))
 
         panel = self._layout.centered(350, 200)
-        inner = draw_panel(surface, panel, title="Rest")
+        key = (self._rested, self._cursor)
+        panel_surf = self._panel_cache.get(key)
+        if panel_surf is None:
+            panel_surf = self._render_panel(panel.size)
+            self._panel_cache[key] = panel_surf
+        surface.blit(panel_surf, panel.topleft)
+
+    def _render_panel(self, size: tuple[int, int]) -> pygame.Surface:
+        """Render the (opaque) rest panel for the current step and cursor."""
+        panel_surf = pygame.Surface(size)
+        panel = panel_surf.get_rect()
+        inner = draw_panel(panel_surf, panel, title="Rest")
 
         if self._rested:
-            draw_text(surface, "The party rests and recovers fully.", inner, colors.HEAL_COLOR)
+            draw_text(panel_surf, "The party rests and recovers fully.", inner, colors.HEAL_COLOR)
             prompt = fonts.small().render("[Enter] to continue", True, colors.LIGHT_GRAY)
-            surface.blit(prompt, (panel.centerx - prompt.get_width() // 2, panel.bottom - 30))
+            panel_surf.blit(prompt, (panel.centerx - prompt.get_width() // 2, panel.bottom - 30))
         else:
-            draw_text(surface, "Rest here and recover HP/MP?", inner, colors.WHITE)
+            draw_text(panel_surf, "Rest here and recover HP/MP?", inner, colors.WHITE)
             menu_rect = pygame.Rect(inner.x, inner.y + 40, inner.width, inner.height - 40)
-            draw_menu(surface, menu_rect, ["Rest", "Cancel"], self._cursor)
+            draw_menu(panel_surf, menu_rect, MENU_ITEMS, self._cursor)
+        return panel_surf
 
     def _cast(self, state: BaseGameState) -> DungeonQuestState:
         assert isinstance(state, DungeonQuestState)
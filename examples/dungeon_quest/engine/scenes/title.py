@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
 from typing import TYPE_CHECKING
 
 import pygame
@@ -14,12 +15,19 @@ from ..rendering.panels import draw_panel
 from ..rendering.menu_renderer import draw_menu
 from ..rendering.sprites import SpriteCache
 from ..state import DungeonQuestState
+from .overworld import OverworldScene
 
 if TYPE_CHECKING:
     from ludos import GameEngine
     from ..context import GameContext
 
-MENU_ITEMS = ["New Game", "Quit"]
+_NEW_GAME = "New Game"
+_QUIT = "Quit"
+MENU_ITEMS = (_NEW_GAME, _QUIT)
+
+# DungeonQuestState fields copied on New Game; engine-managed ones are kept
+_ENGINE_FIELDS = frozenset(f.name for f in fields(BaseGameState))
+_GAME_FIELDS = tuple(f.name for f in fields(DungeonQuestState) if f.name not in _ENGINE_FIELDS)
 
 
 class TitleScene(BaseScene):
@@ -31,14 +39,25 @@ class TitleScene(BaseScene):
         self._state_factory = state_factory  # callable that builds fresh DungeonQuestState
         self._cursor = 0
         self._layout: Layout | None = None
+        self._bg_dimmed: pygame.Surface | None = None
+        self._dirty = True
 
     def on_enter(self, state: BaseGameState) -> None:
         window = self._engine.window
         if window:
             self._layout = Layout(window.width, window.height)
         self._bg_surface = SpriteCache.get_title_illustration()
+        # Copy so the alpha does not leak into the shared cached sprite
+        self._bg_dimmed = self._bg_surface.copy() if self._bg_surface else None
+        if self._bg_dimmed:
+            self._bg_dimmed.set_alpha(100)
+        self._title_surf = fonts.title().render("Dungeon Quest", True, colors.YELLOW)
+        self._sub_surf = fonts.normal().render(self._ctx.quest_pack.name, True, colors.LIGHT_GRAY)
+        self._font_large = fonts.large()
+        self._dirty = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
+        self._dirty = True
         if event.action == "move_up":
             self._cursor = (self._cursor - 1) % len(MENU_ITEMS)
         elif event.action == "move_down":
@@ -49,41 +68,35 @@ class TitleScene(BaseScene):
     def update(self, dt: float, state: BaseGameState) -> None:
         pass
 
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        return self._dirty
+
     def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
+        self._draw(surface, state)
+        self._dirty = False
+
+    def _draw(self, surface: pygame.Surface, state: BaseGameState) -> None:
         if not self._layout:
             return
 
         # Background illustration (dimmed)
-        if self._bg_surface:
-            bg_rect = self._bg_surface.get_rect(
-                center=(self._layout.width // 2, self._layout.height // 3)
-            )
-            dimmed = self._bg_surface.copy()
-            dimmed.set_alpha(100)
-            surface.blit(dimmed, bg_rect)
-
-        # Title
-        title_font = fonts.title()
-        title_surf = title_font.render("Dungeon Quest", True, colors.YELLOW)
-        title_rect = title_surf.get_rect(center=(self._layout.width // 2, self._layout.height // 3))
-        surface.blit(title_surf, title_rect)
-
-        # Quest name subtitle
-        subtitle_font = fonts.normal()
-        subtitle = self._ctx.quest_pack.name
-        sub_surf = subtitle_font.render(subtitle, True, colors.LIGHT_GRAY)
-        sub_rect = sub_surf.get_rect(center=(self._layout.width // 2, self._layout.height // 3 + 50))
-        surface.blit(sub_surf, sub_rect)
+        center_x, third_y = self._layout.width // 2, self._layout.height // 3
+        if self._bg_dimmed:
+            surface.blit(self._bg_dimmed, self._bg_dimmed.get_rect(center=(center_x, third_y)))
+
+        # Title and quest name subtitle
+        surface.blit(self._title_surf, self._title_surf.get_rect(center=(center_x, third_y)))
+        surface.blit(self._sub_surf, self._sub_surf.get_rect(center=(center_x, third_y + 50)))
 
         # Menu
         menu_w, menu_h = 200, 100
         menu_rect = self._layout.centered(menu_w, menu_h)
         menu_rect.y = self._layout.height // 2 + 20
-        draw_menu(surface, menu_rect, MENU_ITEMS, self._cursor, font=fonts.large())
+        draw_menu(surface, menu_rect, MENU_ITEMS, self._cursor, font=self._font_large)
 
     def _select(self, state: BaseGameState) -> None:
         action = MENU_ITEMS[self._cursor]
-        if action == "New Game":
+        if action == _NEW_GAME:
             # Build fresh state if factory provided
             if self._state_factory:
                 new_state = self._state_factory()
@@ -93,25 +106,15 @@ class TitleScene(BaseScene):
             s = state
             assert isinstance(s, DungeonQuestState)
 
-            from .overworld import OverworldScene
             scene = OverworldScene(self._engine, self._ctx)
             self._engine.scene_manager.replace(scene, s)
 
-        elif action == "Quit":
+        elif action == _QUIT:
             self._engine.stop()
 
     def _copy_state(self, target: DungeonQuestState, source: DungeonQuestState) -> None:
-        """Copy all fields from source to target."""
-        target.party = source.party
-        target.gold = source.gold
-        target.inventory = list(source.inventory)
-        target.combat = source.combat
-        target.exploration = source.exploration
-        target.dialogue = source.dialogue
-        target.quest = source.quest
-        target.message_log = list(source.message_log)
-        target.notification = source.notification
-        target.show_intro = source.show_intro
-        target.intro_text = source.intro_text
-        target.game_won = source.game_won
-        target.victory_text = source.victory_text
+        """Copy all game fields from source to target."""
+        for name in _GAME_FIELDS:
+            setattr(target, name, getattr(source, name))
+        target.inventory = source.inventory[:]
+        target.message_log = source.message_log[:]
@@ -6,11 +6,11 @@ from dataclasses import dataclass, field
 
 from ludos import BaseGameState
 
-from ..content.types import AbilityDef, AbilityEffect, CharacterClass, EquipmentSlot
+from ..content.types import AbilityDef, AbilityEffect, CharacterClass
 from .types import CombatPhase
 
 
-@dataclass
+@dataclass(slots=True)
 class ActiveBuff:
     effect: AbilityEffect
     power: int
@@ -18,12 +18,13 @@ class ActiveBuff:
     source_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     name: str
     char_class: CharacterClass
     level: int
     xp: int
+    xp_to_next: int  # kept equal to xp_for_level(level + 1)
     current_hp: int
     max_hp: int
     current_mp: int
@@ -31,19 +32,18 @@ class Character:
     base_attack: int
     base_defense: int
     base_speed: int
-    equipment: dict[EquipmentSlot, str | None] = field(
-        default_factory=lambda: {
-            EquipmentSlot.WEAPON: None,
-            EquipmentSlot.ARMOR: None,
-            EquipmentSlot.ACCESSORY: None,
-        }
-    )
+    # Equipped item_id per slot
+    weapon_id: str | None = None
+    armor_id: str | None = None
+    accessory_id: str | None = None
     abilities: list[AbilityDef] = field(default_factory=list)
+    # First few abilities, as shown on the party screen; refreshed on learn
+    visible_abilities: tuple[AbilityDef, ...] = ()
     buffs: list[ActiveBuff] = field(default_factory=list)
     is_dead: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     name: str
     enemy_id: str
@@ -58,7 +58,7 @@ class Enemy:
     is_dead: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatState:
     encounter_id: str = ""
     enemies: list[Enemy] = field(default_factory=list)
@@ -79,19 +79,19 @@ class CombatState:
     current_actor: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationState:
     current_area_id: str = ""
     dungeon_level_id: str | None = None
     player_x: int = 0
     player_y: int = 0
     in_dungeon: bool = False
-    triggered_once: set[str] = field(default_factory=set)  # "x,y,level_id"
+    triggered_once: set[int] = field(default_factory=set)  # see exploration.dungeon.trigger_key
     overworld_cursor: int = 0
     dungeon_level_index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogueState:
     active_dialogue_id: str | None = None
     current_node_id: str | None = None
@@ -101,7 +101,7 @@ class DialogueState:
     waiting_for_input: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestState:
     flags: set[str] = field(default_factory=set)
     completed_objectives: set[str] = field(default_factory=set)
@@ -27,3 +27,13 @@ class GamePhase(Enum):
     PARTY = auto()
     REST = auto()
     GAME_OVER = auto()
+
+
+class ActionKind(Enum):
+    TRAVEL = auto()
+    TRAVEL_LOCKED = auto()
+    DUNGEON = auto()
+    TALK = auto()
+    REST = auto()
+    PARTY = auto()
+    INVENTORY = auto()
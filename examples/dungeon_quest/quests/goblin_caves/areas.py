@@ -6,36 +6,43 @@ from examples.dungeon_quest.content.types import (
     OverworldArea,
     TileTrigger,
     TileType,
+    pack_tiles,
 )
 
-T = TileType
+# Map legend; matches the symbols drawn on dungeon tiles
+_CHAR_TO_TILE = {
+    "#": TileType.WALL,
+    ".": TileType.FLOOR,
+    "+": TileType.DOOR,
+    "v": TileType.STAIRS_DOWN,
+    "^": TileType.STAIRS_UP,
+    "$": TileType.CHEST,
+    "!": TileType.TRAP,
+    "?": TileType.NPC,
+    "E": TileType.ENTRANCE,
+}
+
+
+def _parse(src: str) -> tuple[tuple[TileType, ...], ...]:
+    """Turn an ASCII map (one row per line) into rows of tile types."""
+    return tuple(tuple(_CHAR_TO_TILE[ch] for ch in line) for line in src.split())
 
-# Shorthand aliases
-F = T.FLOOR
-W = T.WALL
-D = T.DOOR
-SD = T.STAIRS_DOWN
-SU = T.STAIRS_UP
-CH = T.CHEST
-TR = T.TRAP
-NP = T.NPC
-EN = T.ENTRANCE
 
 # ── Dungeon Level 1: Cave Entrance ──
 
-CAVE_L1_TILES = (
-    (W, W, W, W, W, W, W, W, W, W, W, W, W, W, W),
-    (W, EN,F, F, F, W, F, F, F, F, F, W, F, F, W),
-    (W, F, F, W, F, W, F, W, W, W, F, W, F, F, W),
-    (W, F, W, W, F, F, F, F, F, W, F, F, F, W, W),
-    (W, F, F, F, F, W, W, W, F, W, F, W, F, F, W),
-    (W, W, W, D, W, W, F, F, F, F, F, W, W, F, W),
-    (W, F, F, F, F, F, F, W, W, W, F, F, F, F, W),
-    (W, F, W, W, W, W, F, W, CH,W, F, W, W, F, W),
-    (W, F, F, F, F, F, F, F, F, F, F, F, F, F, W),
-    (W, W, W, W, W, W, W, W, W, W, W, SD,W, W, W),
-    (W, W, W, W, W, W, W, W, W, W, W, W, W, W, W),
-)
+CAVE_L1_TILES = _parse("""
+###############
+#E...#.....#..#
+#..#.#.###.#..#
+#.##.....#...##
+#....###.#.#..#
+###+##.....##.#
+#......###....#
+#.####.#$#.##.#
+#.............#
+###########v###
+###############
+""")
 
 CAVE_L1_TRIGGERS = (
     TileTrigger(x=8, y=7, item_id="health_potion", once=True, text="You find a health potion in the chest!"),
@@ -48,7 +55,7 @@ CAVE_LEVEL_1 = DungeonLevel(
     name="Goblin Caves — Entrance",
     width=15,
     height=11,
-    tiles=CAVE_L1_TILES,
+    tiles=pack_tiles(CAVE_L1_TILES),
     player_start=(1, 1),
     triggers=CAVE_L1_TRIGGERS,
     random_encounter_ids=("cave_bats",),
@@ -57,19 +64,19 @@ CAVE_LEVEL_1 = DungeonLevel(
 
 # ── Dungeon Level 2: Deep Caves ──
 
-CAVE_L2_TILES = (
-    (W, W, W, W, W, W, W, W, W, W, W, W, W, W, W),
-    (W, SU,F, F, F, F, F, W, F, F, F, F, F, F, W),
-    (W, F, W, W, W, W, F, W, F, W, W, W, W, F, W),
-    (W, F, F, F, TR,W, F, F, F, F, F, NP,W, F, W),
-    (W, W, W, W, F, W, F, W, W, W, W, W, W, F, W),
-    (W, F, F, F, F, F, F, F, F, F, F, F, F, F, W),
-    (W, F, W, W, W, W, W, D, W, W, W, W, W, F, W),
-    (W, F, F, F, F, F, F, F, F, F, F, F, F, F, W),
-    (W, W, W, W, W, W, F, W, F, W, W, W, W, F, W),
-    (W, F, F, CH,F, F, F, W, F, F, F, F, SD,F, W),
-    (W, W, W, W, W, W, W, W, W, W, W, W, W, W, W),
-)
+CAVE_L2_TILES = _parse("""
+###############
+#^.....#......#
+#.####.#.####.#
+#...!#.....?#.#
+####.#.######.#
+#.............#
+#.#####+#####.#
+#.............#
+######.#.####.#
+#..$...#....v.#
+###############
+""")
 
 CAVE_L2_TRIGGERS = (
     TileTrigger(x=4, y=3, encounter_id="cave_spiders", once=True, text="Spiders ambush you!"),
@@ -83,7 +90,7 @@ CAVE_LEVEL_2 = DungeonLevel(
     name="Goblin Caves — Deep Tunnels",
     width=15,
     height=11,
-    tiles=CAVE_L2_TILES,
+    tiles=pack_tiles(CAVE_L2_TILES),
     player_start=(1, 1),
     triggers=CAVE_L2_TRIGGERS,
     random_encounter_ids=("cave_spiders", "cave_bats"),
@@ -92,17 +99,17 @@ CAVE_LEVEL_2 = DungeonLevel(
 
 # ── Dungeon Level 3: Chief's Lair ──
 
-CAVE_L3_TILES = (
-    (W, W, W, W, W, W, W, W, W, W, W),
-    (W, SU,F, F, F, F, F, F, F, F, W),
-    (W, F, F, W, F, W, F, W, F, F, W),
-    (W, F, W, F, F, F, F, F, W, F, W),
-    (W, F, F, F, F, TR,F, F, F, F, W),
-    (W, F, W, F, F, F, F, F, W, F, W),
-    (W, F, F, W, F, CH,F, W, F, F, W),
-    (W, F, F, F, F, F, F, F, F, F, W),
-    (W, W, W, W, W, W, W, W, W, W, W),
-)
+CAVE_L3_TILES = _parse("""
+###########
+#^........#
+#..#.#.#..#
+#.#.....#.#
+#....!....#
+#.#.....#.#
+#..#.$.#..#
+#.........#
+###########
+""")
 
 CAVE_L3_TRIGGERS = (
     TileTrigger(x=5, y=4, encounter_id="goblin_chief_battle", once=True,
@@ -117,7 +124,7 @@ CAVE_LEVEL_3 = DungeonLevel(
     name="Goblin Caves — Chief's Lair",
     width=11,
     height=9,
-    tiles=CAVE_L3_TILES,
+    tiles=pack_tiles(CAVE_L3_TILES),
     player_start=(1, 1),
     triggers=CAVE_L3_TRIGGERS,
 )
@@ -1,54 +1,129 @@
 """Minimax AI for tic-tac-toe."""
 
-from examples.tic_tac_toe.state import Board, Player, check_winner, GameStatus
+from examples.tic_tac_toe.state import FULL, WIN_MASKS, Player
 
 
-def _opponent(player: Player) -> Player:
-    return Player.O if player == Player.X else Player.X
+# 1 at every 9-bit mask that contains a complete line
+_HAS_LINE = bytes(any(mask & m == m for m in WIN_MASKS) for mask in range(512))
 
 
-def minimax(board: Board, is_maximizing: bool, ai: Player, depth: int = 0) -> int:
-    """Return score for the current board position."""
-    status, _ = check_winner(board)
-    if status == GameStatus.X_WINS:
-        return (10 - depth) if ai == Player.X else -(10 - depth)
-    if status == GameStatus.O_WINS:
-        return (10 - depth) if ai == Player.O else -(10 - depth)
-    if status == GameStatus.DRAW:
+def _won(mask: int) -> bool:
+    return _HAS_LINE[mask] == 1
+
+
+# Centre, corners, then edges: strong moves first make cutoffs come early
+MOVE_ORDER = tuple(1 << cell for cell in (4, 0, 2, 6, 8, 1, 3, 5, 7))
+
+# Transposition table: (me, them) -> (score, bound kind)
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+_table: dict[tuple[int, int], tuple[int, int]] = {}
+
+
+def _negamax(me: int, them: int, alpha: int, beta: int) -> int:
+    """Score an undecided position for the side to move, who holds *me*.
+
+    A win scores 1 + the number of empty cells left, so quicker wins (and
+    slower losses) are preferred; draws score 0. Alpha-beta: the result is
+    exact inside (alpha, beta) and only a bound outside it.
+    """
+    key = (me, them)
+    entry = _table.get(key)
+    if entry is not None:
+        score, kind = entry
+        if kind == _EXACT:
+            return score
+        if kind == _LOWER and score > alpha:
+            alpha = score
+        elif kind == _UPPER and score < beta:
+            beta = score
+        if alpha >= beta:
+            return score
+
+    empty = FULL & ~(me | them)
+    if not empty:
+        _table[key] = (0, _EXACT)
         return 0
+    # Empty cells left after this move; an immediate win can't be beaten
+    win = empty.bit_count()
+    start_alpha = alpha
+    best = -100
+    for bit in MOVE_ORDER:
+        if not empty & bit:
+            continue
+        if _HAS_LINE[me | bit]:
+            _table[key] = (win, _EXACT)
+            return win
+        score = -_negamax(them, me | bit, -beta, -alpha)
+        if score > best:
+            best = score
+            if best > alpha:
+                alpha = best
+                if alpha >= beta:
+                    break
 
-    if is_maximizing:
-        best = -100
-        for r in range(3):
-            for c in range(3):
-                if board[r][c] is None:
-                    board[r][c] = ai
-                    best = max(best, minimax(board, False, ai, depth + 1))
-                    board[r][c] = None
-        return best
+    if best <= start_alpha:
+        _table[key] = (best, _UPPER)
+    elif best >= beta:
+        _table[key] = (best, _LOWER)
     else:
-        best = 100
-        opponent = _opponent(ai)
-        for r in range(3):
-            for c in range(3):
-                if board[r][c] is None:
-                    board[r][c] = opponent
-                    best = min(best, minimax(board, True, ai, depth + 1))
-                    board[r][c] = None
-        return best
-
-
-def best_move(board: Board, ai: Player) -> tuple[int, int] | None:
-    """Find the best move for the AI player."""
+        _table[key] = (best, _EXACT)
+    return best
+
+
+def _choose(x: int, o: int, ai_is_x: bool) -> tuple[int, int] | None:
+    me, them = (x, o) if ai_is_x else (o, x)
+    empty = FULL & ~(me | them)
+    win = empty.bit_count()
     best_score = -100
     move = None
-    for r in range(3):
-        for c in range(3):
-            if board[r][c] is None:
-                board[r][c] = ai
-                score = minimax(board, False, ai, 0)
-                board[r][c] = None
-                if score > best_score:
-                    best_score = score
-                    move = (r, c)
+    # Lowest bit first, i.e. row-major order; ties keep the earliest cell.
+    # Each reply only has to show whether it beats best_score.
+    while empty:
+        bit = empty & -empty
+        empty ^= bit
+        if _HAS_LINE[me | bit]:
+            score = win
+        else:
+            score = -_negamax(them, me | bit, -100, -best_score)
+        if score > best_score:
+            best_score = score
+            move = divmod(bit.bit_length() - 1, 3)
+    return move
+
+
+def _build_policy() -> dict[tuple[int, int, bool], tuple[int, int]]:
+    """Map every reachable, undecided position to the move for its side."""
+    policy: dict[tuple[int, int, bool], tuple[int, int]] = {}
+    seen: set[tuple[int, int]] = set()
+    stack = [(0, 0)]
+    while stack:
+        x, o = stack.pop()
+        if (x, o) in seen:
+            continue
+        seen.add((x, o))
+        empty = FULL & ~(x | o)
+        if not empty or _won(x) or _won(o):
+            continue
+        x_to_move = x.bit_count() == o.bit_count()
+        move = _choose(x, o, x_to_move)
+        if move is not None:
+            policy[(x, o, x_to_move)] = move
+        while empty:
+            bit = empty & -empty
+            empty ^= bit
+            stack.append((x | bit, o) if x_to_move else (x, o | bit))
+    return policy
+
+
+# Full game is ~4.5k positions, small enough to solve once at import
+_POLICY = _build_policy()
+
+
+def best_move(x: int, o: int, ai: Player) -> tuple[int, int] | None:
+    """Find the best move for the AI player."""
+    ai_is_x = ai is Player.X
+    move = _POLICY.get((x, o, ai_is_x))
+    if move is None:
+        # Position off the normal turn order (or already decided)
+        move = _choose(x, o, ai_is_x)
     return move
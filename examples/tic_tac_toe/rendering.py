@@ -2,7 +2,7 @@
 
 import pygame
 
-from examples.tic_tac_toe.state import Board, Player, GameStatus
+from examples.tic_tac_toe.state import Player, GameStatus
 
 # Layout constants
 GRID_SIZE = 450
@@ -11,6 +11,8 @@ GRID_X = 75  # (600 - 450) / 2
 GRID_Y = 120
 LINE_WIDTH = 4
 MARK_PADDING = 25
+STATUS_Y = 50
+INSTRUCTIONS_Y = GRID_Y + GRID_SIZE + 50
 
 # Colors
 WHITE = (255, 255, 255)
@@ -21,17 +23,49 @@ BLUE = (50, 100, 220)
 YELLOW = (255, 220, 50)
 DARK_BG = (30, 30, 40)
 
+_fonts: dict[int, pygame.font.Font] = {}
+
+
+def _font(size: int) -> pygame.font.Font:
+    """Default font at *size*, loaded once."""
+    font = _fonts.get(size)
+    if font is None:
+        font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+TEXT_CACHE_SIZE = 64
+_text_cache: dict[
+    tuple[str, int, tuple[int, int, int], tuple[int, int]], tuple[pygame.Surface, pygame.Rect]
+] = {}
+
+
+def _blit_text(
+    surface: pygame.Surface, text: str, size: int, color: tuple[int, int, int], y: int
+) -> None:
+    """Blit *text* centred on row *y*; the rendering and its rect are reused."""
+    center = (surface.get_width() // 2, y)
+    key = (text, size, color, center)
+    entry = _text_cache.get(key)
+    if entry is None:
+        if len(_text_cache) >= TEXT_CACHE_SIZE:
+            del _text_cache[next(iter(_text_cache))]  # oldest first
+        rendered = _font(size).render(text, True, color)
+        entry = _text_cache[key] = (rendered, rendered.get_rect(center=center))
+    surface.blit(*entry)
+
+
+# Grid-relative pixel offset -> row/column index
+_CELL_OF_PIXEL = bytes(p // CELL_SIZE for p in range(GRID_SIZE))
+
 
 def pos_to_cell(pos: tuple[int, int]) -> tuple[int, int] | None:
     """Convert pixel position to grid (row, col), or None if outside grid."""
-    x, y = pos
-    if x < GRID_X or x >= GRID_X + GRID_SIZE:
-        return None
-    if y < GRID_Y or y >= GRID_Y + GRID_SIZE:
-        return None
-    col = (x - GRID_X) // CELL_SIZE
-    row = (y - GRID_Y) // CELL_SIZE
-    return (row, col)
+    dx = pos[0] - GRID_X
+    dy = pos[1] - GRID_Y
+    if 0 <= dx < GRID_SIZE and 0 <= dy < GRID_SIZE:
+        return (_CELL_OF_PIXEL[dy], _CELL_OF_PIXEL[dx])
+    return None
 
 
 def draw_grid(surface: pygame.Surface) -> None:
@@ -45,41 +79,70 @@ def draw_grid(surface: pygame.Surface) -> None:
         pygame.draw.line(surface, GRAY, (GRID_X, y), (GRID_X + GRID_SIZE, y), LINE_WIDTH)
 
 
-def draw_x(surface: pygame.Surface, row: int, col: int, color: tuple[int, int, int] = RED) -> None:
-    """Draw an X mark in the given cell."""
+_grid_bg: pygame.Surface | None = None
+
+
+def get_grid_background(size: tuple[int, int]) -> pygame.Surface:
+    """DARK_BG with the grid drawn on it, built once per window size."""
+    global _grid_bg
+    if _grid_bg is None or _grid_bg.get_size() != size:
+        _grid_bg = pygame.Surface(size)
+        _grid_bg.fill(DARK_BG)
+        draw_grid(_grid_bg)
+    return _grid_bg
+
+
+def _cell_geom(idx: int) -> tuple[int, int, int, int, int, int]:
+    """X corners (x1, y1, x2, y2) and O centre (cx, cy) for cell *idx*."""
+    row, col = divmod(idx, 3)
     x1 = GRID_X + col * CELL_SIZE + MARK_PADDING
     y1 = GRID_Y + row * CELL_SIZE + MARK_PADDING
     x2 = GRID_X + (col + 1) * CELL_SIZE - MARK_PADDING
     y2 = GRID_Y + (row + 1) * CELL_SIZE - MARK_PADDING
-    pygame.draw.line(surface, color, (x1, y1), (x2, y2), LINE_WIDTH + 2)
-    pygame.draw.line(surface, color, (x2, y1), (x1, y2), LINE_WIDTH + 2)
-
-
-def draw_o(surface: pygame.Surface, row: int, col: int, color: tuple[int, int, int] = BLUE) -> None:
-    """Draw an O mark in the given cell."""
     cx = GRID_X + col * CELL_SIZE + CELL_SIZE // 2
     cy = GRID_Y + row * CELL_SIZE + CELL_SIZE // 2
-    radius = CELL_SIZE // 2 - MARK_PADDING
-    pygame.draw.circle(surface, color, (cx, cy), radius, LINE_WIDTH + 2)
+    return x1, y1, x2, y2, cx, cy
+
+
+_CELL_GEOM = tuple(_cell_geom(i) for i in range(9))
+CELL_RECTS = tuple(
+    pygame.Rect(GRID_X + i % 3 * CELL_SIZE, GRID_Y + i // 3 * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+    for i in range(9)
+)
+O_RADIUS = CELL_SIZE // 2 - MARK_PADDING
+MARK_WIDTH = LINE_WIDTH + 2
+
 
+def draw_x(surface: pygame.Surface, idx: int, color: tuple[int, int, int] = RED) -> None:
+    """Draw an X mark in cell *idx* (row * 3 + col)."""
+    x1, y1, x2, y2, _, _ = _CELL_GEOM[idx]
+    pygame.draw.line(surface, color, (x1, y1), (x2, y2), MARK_WIDTH)
+    pygame.draw.line(surface, color, (x2, y1), (x1, y2), MARK_WIDTH)
 
-def draw_board(surface: pygame.Surface, board: Board, winning_cells: list[tuple[int, int]]) -> None:
+
+def draw_o(surface: pygame.Surface, idx: int, color: tuple[int, int, int] = BLUE) -> None:
+    """Draw an O mark in cell *idx* (row * 3 + col)."""
+    _, _, _, _, cx, cy = _CELL_GEOM[idx]
+    pygame.draw.circle(surface, color, (cx, cy), O_RADIUS, MARK_WIDTH)
+
+
+def draw_board(
+    surface: pygame.Surface, x_bits: int, o_bits: int, winning_mask: int
+) -> None:
     """Draw all marks on the board with winning highlight."""
-    for r in range(3):
-        for c in range(3):
-            cell = board[r][c]
-            if cell is None:
-                continue
-            is_winner = (r, c) in winning_cells
-            if cell == Player.X:
-                draw_x(surface, r, c, YELLOW if is_winner else RED)
-            else:
-                draw_o(surface, r, c, YELLOW if is_winner else BLUE)
+    for i in range(9):
+        bit = 1 << i
+        if not (x_bits | o_bits) & bit:
+            continue
+        is_winner = winning_mask & bit
+        if x_bits & bit:
+            draw_x(surface, i, YELLOW if is_winner else RED)
+        else:
+            draw_o(surface, i, YELLOW if is_winner else BLUE)
 
 
 def draw_status(surface: pygame.Surface, status: GameStatus, current_player: Player) -> None:
     """Draw status text above the grid."""
-    font = pygame.font.Font(None, 40)
     if status == GameStatus.PLAYING:
         text = f"Player {current_player.value}'s turn"
     elif status == GameStatus.X_WINS:
@@ -88,18 +151,21 @@ def draw_status(surface: pygame.Surface, status: GameStatus, current_player: Pla
         text = "O wins!"
     else:
         text = "Draw!"
-    rendered = font.render(text, True, WHITE)
-    rect = rendered.get_rect(center=(surface.get_width() // 2, 50))
-    surface.blit(rendered, rect)
+    _blit_text(surface, text, 40, WHITE, STATUS_Y)
 
 
 def draw_instructions(surface: pygame.Surface, status: GameStatus) -> None:
     """Draw instruction text below the grid."""
-    font = pygame.font.Font(None, 28)
     if status == GameStatus.PLAYING:
         text = "Click a cell to play  |  ESC = menu"
     else:
         text = "Click anywhere to return to menu"
-    rendered = font.render(text, True, GRAY)
-    rect = rendered.get_rect(center=(surface.get_width() // 2, GRID_Y + GRID_SIZE + 50))
-    surface.blit(rendered, rect)
+    _blit_text(surface, text, 28, GRAY, INSTRUCTIONS_Y)
+
+
+def text_bands(width: int) -> list[pygame.Rect]:
+    """Full-width strips holding the status and instruction lines."""
+    return [
+        pygame.Rect(0, STATUS_Y - 30, width, 60),
+        pygame.Rect(0, INSTRUCTIONS_Y - 25, width, 50),
+    ]
@@ -7,20 +7,21 @@ from ludos.input.events import InputEvent, InputType
 
 from examples.tic_tac_toe.ai import best_move
 from examples.tic_tac_toe.rendering import (
-    DARK_BG,
+    CELL_RECTS,
     draw_board,
-    draw_grid,
     draw_instructions,
     draw_status,
+    get_grid_background,
     pos_to_cell,
+    text_bands,
 )
 from examples.tic_tac_toe.state import (
     GameMode,
+    OPPONENT,
     GameStatus,
     Player,
     TicTacToeState,
-    check_winner,
-    empty_board,
+    check_winner_after,
 )
 
 AI_DELAY = 0.4
@@ -29,19 +30,25 @@ AI_DELAY = 0.4
 class GameScene(BaseScene):
     """Handles gameplay and game-over display."""
     input_repeat_delay = 1.0
+    input_types = frozenset({InputType.KEY_DOWN, InputType.MOUSE_DOWN})
 
     def __init__(self, engine, mode: GameMode) -> None:
         self._engine = engine
         self._mode = mode
+        self._dirty = True
+        self._full_redraw = True
+        self._changed_cells = 0
 
     def on_enter(self, state: BaseGameState) -> None:
         ttt = self._ttt(state)
-        ttt.board = empty_board()
+        ttt.x_bits = ttt.o_bits = 0
         ttt.current_player = Player.X
         ttt.status = GameStatus.PLAYING
         ttt.mode = self._mode
-        ttt.winning_cells = []
+        ttt.winning_mask = 0
         ttt.ai_timer = 0.0
+        self._dirty = True
+        self._full_redraw = True
 
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         ttt = self._ttt(state)
@@ -68,7 +75,7 @@ class GameScene(BaseScene):
             return
 
         row, col = cell
-        if ttt.board[row][col] is not None:
+        if (ttt.x_bits | ttt.o_bits) >> (row * 3 + col) & 1:
             return
 
         self._place(ttt, row, col)
@@ -82,29 +89,50 @@ class GameScene(BaseScene):
         ):
             ttt.ai_timer += dt
             if ttt.ai_timer >= AI_DELAY:
-                move = best_move(ttt.board, ttt.ai_player)
+                move = best_move(ttt.x_bits, ttt.o_bits, ttt.ai_player)
                 if move:
                     self._place(ttt, *move)
 
-    def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        # Only a placed mark changes the picture; the AI delay draws nothing
+        return self._dirty
+
+    def render(
+        self, surface: pygame.Surface, state: BaseGameState
+    ) -> list[pygame.Rect] | None:
         ttt = self._ttt(state)
-        surface.fill(DARK_BG)
+        surface.blit(get_grid_background(surface.get_size()), (0, 0))
         draw_status(surface, ttt.status, ttt.current_player)
-        draw_grid(surface)
-        draw_board(surface, ttt.board, ttt.winning_cells)
+        draw_board(surface, ttt.x_bits, ttt.o_bits, ttt.winning_mask)
         draw_instructions(surface, ttt.status)
+        self._dirty = False
+
+        # After a move only the text lines and the touched cells differ
+        rects = None
+        if not self._full_redraw:
+            rects = text_bands(surface.get_width())
+            rects += [CELL_RECTS[i] for i in range(9) if self._changed_cells >> i & 1]
+        self._full_redraw = False
+        self._changed_cells = 0
+        return rects
 
     def _ttt(self, state: BaseGameState) -> TicTacToeState:
         assert isinstance(state, TicTacToeState)
         return state
 
     def _place(self, ttt: TicTacToeState, row: int, col: int) -> None:
-        ttt.board[row][col] = ttt.current_player
-        status, cells = check_winner(ttt.board)
+        bit = 1 << (row * 3 + col)
+        if ttt.current_player is Player.X:
+            ttt.x_bits |= bit
+        else:
+            ttt.o_bits |= bit
+        status, mask = check_winner_after(ttt.x_bits, ttt.o_bits, row, col)
         ttt.status = status
-        ttt.winning_cells = cells
+        ttt.winning_mask = mask
+        self._dirty = True
+        self._changed_cells |= bit | mask
         if status == GameStatus.PLAYING:
-            ttt.current_player = Player.O if ttt.current_player == Player.X else Player.X
+            ttt.current_player = OPPONENT[ttt.current_player]
             ttt.ai_timer = 0.0
 
     def _return_to_menu(self, ttt: TicTacToeState) -> None:
@@ -1,6 +1,6 @@
 """Tic-tac-toe game state."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
 
 from ludos import BaseGameState
@@ -11,6 +11,9 @@ class Player(Enum):
     O = "O"
 
 
+OPPONENT: dict[Player, Player] = {Player.X: Player.O, Player.O: Player.X}
+
+
 class GameMode(Enum):
     ONE_PLAYER = auto()
     TWO_PLAYER = auto()
@@ -23,47 +26,43 @@ class GameStatus(Enum):
     DRAW = auto()
 
 
-Board = list[list[Player | None]]
+# Boards are two 9-bit masks, one per player, with cell (r, c) at bit r * 3 + c
+FULL = 0o777
 
-WIN_LINES = [
-    # Rows
-    [(0, 0), (0, 1), (0, 2)],
-    [(1, 0), (1, 1), (1, 2)],
-    [(2, 0), (2, 1), (2, 2)],
-    # Columns
-    [(0, 0), (1, 0), (2, 0)],
-    [(0, 1), (1, 1), (2, 1)],
-    [(0, 2), (1, 2), (2, 2)],
-    # Diagonals
-    [(0, 0), (1, 1), (2, 2)],
-    [(0, 2), (1, 1), (2, 0)],
-]
+# Rows, columns, diagonals
+WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
 
+# Win masks through each cell: 4 for the centre, 3 for corners, 2 for edges
+LINES_THROUGH = tuple(tuple(m for m in WIN_MASKS if m >> i & 1) for i in range(9))
 
-def empty_board() -> Board:
-    return [[None, None, None] for _ in range(3)]
 
+def check_winner_after(x_bits: int, o_bits: int, row: int, col: int) -> tuple[GameStatus, int]:
+    """Check an undecided board that just got a mark at (row, col).
 
-def check_winner(board: Board) -> tuple[GameStatus, list[tuple[int, int]]]:
-    """Check board for a winner or draw. Returns (status, winning_cells)."""
-    for line in WIN_LINES:
-        cells = [board[r][c] for r, c in line]
-        if cells[0] is not None and cells[0] == cells[1] == cells[2]:
-            status = GameStatus.X_WINS if cells[0] == Player.X else GameStatus.O_WINS
-            return status, list(line)
+    Returns (status, winning_mask). Only lines through that cell, and only the mover's, can have completed.
+    """
+    idx = row * 3 + col
+    if x_bits >> idx & 1:
+        bits, status = x_bits, GameStatus.X_WINS
+    else:
+        bits, status = o_bits, GameStatus.O_WINS
+    for mask in LINES_THROUGH[idx]:
+        if bits & mask == mask:
+            return status, mask
 
-    if all(board[r][c] is not None for r in range(3) for c in range(3)):
-        return GameStatus.DRAW, []
+    if x_bits | o_bits == FULL:
+        return GameStatus.DRAW, 0
 
-    return GameStatus.PLAYING, []
+    return GameStatus.PLAYING, 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TicTacToeState(BaseGameState):
-    board: Board = field(default_factory=empty_board)
+    x_bits: int = 0
+    o_bits: int = 0
     current_player: Player = Player.X
     status: GameStatus = GameStatus.PLAYING
     mode: GameMode = GameMode.ONE_PLAYER
-    winning_cells: list[tuple[int, int]] = field(default_factory=list)
+    winning_mask: int = 0
     ai_player: Player = Player.O
     ai_timer: float = 0.0
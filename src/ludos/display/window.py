@@ -76,3 +76,10 @@ class Window:
             pygame.display.flip()
         except pygame.error as e:
             raise RenderError(f"Display flip failed: {e}") from e
+
+    def update(self, rects: list[pygame.Rect]) -> None:
+        """Push only *rects* of the surface to the display."""
+        try:
+            pygame.display.update(rects)
+        except pygame.error as e:
+            raise RenderError(f"Display update failed: {e}") from e
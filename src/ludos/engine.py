@@ -24,6 +24,8 @@ class EngineConfig:
     height: int = 600
     title: str = "Ludos"
     fps: int = 60
+    idle_fps: int = 10
+    precise_timing: bool = False
     bg_color: tuple[int, int, int] = (0, 0, 0)
     display_flags: int = 0
 
@@ -48,6 +50,10 @@ class GameEngine:
         bindings: KeyBindings | None = None,
     ) -> None:
         self._config = config or EngineConfig()
+        if self._config.idle_fps < 1:
+            raise InitializationError(
+                f"idle_fps must be at least 1, got {self._config.idle_fps}"
+            )
         self._state_manager: StateManager = StateManager(
             initial_state or BaseGameState()
         )
@@ -58,6 +64,7 @@ class GameEngine:
         self._initial_scene = initial_scene
         self._action_timestamps: dict[str, float] = {}
         self._active_scene_id: int = 0
+        self._input_types: frozenset[InputType] | None = None
 
     @property
     def state_manager(self) -> StateManager:
@@ -101,13 +108,17 @@ class GameEngine:
 
     def stop(self) -> None:
         """Signal the engine to stop after the current frame."""
-        self._state_manager.update(lambda s: setattr(s, "is_running", False))
+        self._state_manager.set("is_running", False)
 
-    def _should_deliver(self, event: InputEvent, scene: BaseScene) -> bool:
+    def _should_deliver(
+        self, event: InputEvent, scene: BaseScene, now: float | None = None
+    ) -> bool:
         """Check whether an input event should be delivered to the scene.
 
         Throttles repeated KEY_DOWN events with a resolved action based on
         the scene's input_repeat_delay. All other events pass through.
+        *now* is the poll time shared by one frame's events; it defaults
+        to time.monotonic().
         """
         if scene.input_repeat_delay <= 0:
             return True
@@ -116,39 +127,76 @@ class GameEngine:
         if event.action is None:
             return True
 
-        now = time.monotonic()
+        if now is None:
+            now = time.monotonic()
         last = self._action_timestamps.get(event.action, 0.0)
         if now - last < scene.input_repeat_delay:
             return False
         self._action_timestamps[event.action] = now
         return True
 
+    def _filter_events(self, scene: BaseScene) -> None:
+        """Block the pygame event types the scene doesn't read."""
+        wanted = scene.input_types
+        if wanted == self._input_types:
+            return
+        self._input_types = wanted
+        pygame.event.set_allowed(None)
+        if wanted is not None:
+            unread = set(InputType) - wanted - {InputType.QUIT}
+            pygame.event.set_blocked(InputHandler.pygame_event_types(unread))
+
+    @staticmethod
+    def _wait_for_input(timeout_ms: int) -> None:
+        """Sleep until an event is queued or *timeout_ms* passes.
+
+        Idle frames wake as soon as input arrives, so idling adds no input
+        latency. The event is put back for the regular poll.
+        """
+        event = pygame.event.wait(timeout_ms)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
     def _loop(self) -> None:
         """Main game loop: input → update → render."""
         state = self._state_manager.state
         assert self._clock is not None
         assert self._window is not None
 
+        # Above 1000 idle_fps this would round to 0, which waits forever
+        idle_timeout_ms = max(1, 1000 // self._config.idle_fps)
+        idle = False
         while state.is_running:
-            dt = self._clock.tick(self._config.fps) / 1000.0
-
-            self._state_manager.update(lambda s: setattr(s, "frame_count", s.frame_count + 1))
-            self._state_manager.update(lambda s: setattr(s, "elapsed_time", s.elapsed_time + dt))
+            if idle:
+                self._wait_for_input(idle_timeout_ms)
+                dt = self._clock.tick() / 1000.0
+            elif self._config.precise_timing:
+                # Spins instead of sleeping: less frame jitter, more CPU
+                dt = self._clock.tick_busy_loop(self._config.fps) / 1000.0
+            else:
+                dt = self._clock.tick(self._config.fps) / 1000.0
+
+            # Bookkeeping, not a game mutation: leave the dirty flag alone
+            state.frame_count += 1
+            state.elapsed_time += dt
 
             # Input
             events = self._input_handler.poll()
             scene = self._scene_manager.active
 
             # Reset throttle timestamps when the active scene changes
-            if scene is not None and id(scene) != self._active_scene_id:
+            scene_changed = scene is not None and id(scene) != self._active_scene_id
+            if scene_changed:
                 self._active_scene_id = id(scene)
                 self._action_timestamps.clear()
+                self._filter_events(scene)
 
+            now = time.monotonic()
             for event in events:
                 if event.type == InputType.QUIT:
                     self.stop()
                     break
-                if scene and self._should_deliver(event, scene):
+                if scene and self._should_deliver(event, scene, now):
                     scene.handle_input(event, state)
 
             if not state.is_running:
@@ -158,15 +206,30 @@ class GameEngine:
             if scene:
                 scene.update(dt, state)
 
-            # Render
-            self._window.clear(self._config.bg_color)
-            if scene:
-                scene.render(self._window.surface, state)
-            self._window.flip()
+            # Render (skipped while the scene's last frame is still accurate;
+            # a newly active scene always gets its first frame drawn, so
+            # don't idle if input just pushed or popped a scene)
+            idle = (
+                scene is not None
+                and not scene_changed
+                and self._scene_manager.active is scene
+                and not scene.needs_redraw(state)
+            )
+            if not idle:
+                self._window.clear(self._config.bg_color)
+                dirty_rects = scene.render(self._window.surface, state) if scene else None
+                if dirty_rects is None or scene_changed:
+                    self._window.flip()
+                else:
+                    self._window.update(dirty_rects)
 
             self._state_manager.mark_clean()
 
     def _shutdown(self) -> None:
         """Clean up pygame."""
         self._scene_manager.clear(self._state_manager.state)
+        if self._input_types is not None:
+            # The blocked types are global to pygame; don't leak them
+            pygame.event.set_allowed(None)
+            self._input_types = None
         pygame.quit()
@@ -1,5 +1,7 @@
 """Key and mouse bindings that map raw inputs to semantic actions."""
 
+import sys
+
 import pygame
 
 from ludos.errors import InputError
@@ -37,7 +39,7 @@ class KeyBindings:
         """Bind a pygame key constant to a semantic action."""
         if not isinstance(action, str) or not action:
             raise InputError("Action must be a non-empty string")
-        self._key_map[key] = action
+        self._key_map[key] = sys.intern(action)
 
     def unbind_key(self, key: int) -> None:
         """Remove a key binding."""
@@ -47,7 +49,7 @@ class KeyBindings:
         """Bind a mouse button number to a semantic action."""
         if not isinstance(action, str) or not action:
             raise InputError("Action must be a non-empty string")
-        self._mouse_map[button] = action
+        self._mouse_map[button] = sys.intern(action)
 
     def unbind_mouse(self, button: int) -> None:
         """Remove a mouse button binding."""
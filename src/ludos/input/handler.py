@@ -1,6 +1,6 @@
 """Input handler that polls pygame events and converts them."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 
 import pygame
 
@@ -49,6 +49,14 @@ class InputHandler:
             except ValueError:
                 pass
 
+    @classmethod
+    def pygame_event_types(cls, input_types: Iterable[InputType]) -> list[int]:
+        """Return the pygame event types that convert to *input_types*."""
+        wanted = set(input_types)
+        return [
+            pg_type for pg_type, input_type in cls._PG_TYPE_MAP.items() if input_type in wanted
+        ]
+
     def poll(self) -> list[InputEvent]:
         """Poll all pending pygame events and return as InputEvents."""
         events: list[InputEvent] = []
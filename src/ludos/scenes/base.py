@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 
 import pygame
 
-from ludos.input.events import InputEvent
+from ludos.input.events import InputEvent, InputType
 from ludos.state.base import BaseGameState
 
 
@@ -22,6 +22,13 @@ class BaseScene(ABC):
     to slow down repeated key-down events (e.g. menu navigation).
     """
 
+    input_types: frozenset[InputType] | None = None
+    """Input types this scene reads, or None (default) for all of them.
+
+    While the scene is active, pygame drops the other event types before
+    they reach the queue. QUIT is always let through.
+    """
+
     @abstractmethod
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         """Process a single input event."""
@@ -31,8 +38,23 @@ class BaseScene(ABC):
         """Update scene logic. dt is seconds since last frame."""
 
     @abstractmethod
-    def render(self, surface: pygame.Surface, state: BaseGameState) -> None:
-        """Draw the scene to the surface."""
+    def render(
+        self, surface: pygame.Surface, state: BaseGameState
+    ) -> list[pygame.Rect] | None:
+        """Draw the scene to the surface.
+
+        Return the rects that changed since the previous frame to have
+        only those pushed to the display, or None to update all of it.
+        """
+
+    def needs_redraw(self, state: BaseGameState) -> bool:
+        """Return False when the last rendered frame is still accurate.
+
+        The engine then skips render and flip for this frame, and the next
+        frame waits for input, for at most 1 / EngineConfig.idle_fps
+        seconds. Default is True.
+        """
+        return True
 
     def on_enter(self, state: BaseGameState) -> None:
         """Called when this scene becomes the active scene."""
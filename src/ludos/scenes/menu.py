@@ -5,10 +5,12 @@ from dataclasses import dataclass, field
 
 import pygame
 
-from ludos.input.events import InputEvent
+from ludos.input.events import InputEvent, InputType
 from ludos.scenes.base import BaseScene
 from ludos.state.base import BaseGameState
 
+TEXT_CACHE_SIZE = 64
+
 
 @dataclass
 class MenuItem:
@@ -46,6 +48,7 @@ class MenuScene(BaseScene):
     """
 
     input_repeat_delay = 0.15
+    input_types = frozenset({InputType.KEY_DOWN, InputType.MOUSE_DOWN})
 
     def __init__(
         self,
@@ -57,6 +60,7 @@ class MenuScene(BaseScene):
         self._selected = 0
         self._font: pygame.font.Font | None = None
         self._title_font: pygame.font.Font | None = None
+        self._text_cache: dict[tuple[bool, str, tuple[int, int, int]], pygame.Surface] = {}
 
     @property
     def items(self) -> list[MenuItem]:
@@ -81,6 +85,20 @@ class MenuScene(BaseScene):
                 self._config.font_name, self._config.title_font_size
             )
 
+    def _render_text(
+        self, title: bool, text: str, color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Rendered *text* in the title or item font, reused across frames."""
+        key = (title, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            font = self._title_font if title else self._font
+            assert font is not None
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
+
     def handle_input(self, event: InputEvent, state: BaseGameState) -> None:
         if event.action == "move_up":
             self.selected -= 1
@@ -101,13 +119,13 @@ class MenuScene(BaseScene):
         surface.fill(self._config.bg_color)
         center_x = surface.get_width() // 2
         y = surface.get_height() // 4
+        blits: list[tuple[pygame.Surface, pygame.Rect]] = []
 
         if self._config.title:
-            title_surf = self._title_font.render(
-                self._config.title, True, self._config.text_color
+            title_surf = self._render_text(
+                True, self._config.title, self._config.text_color
             )
-            title_rect = title_surf.get_rect(center=(center_x, y))
-            surface.blit(title_surf, title_rect)
+            blits.append((title_surf, title_surf.get_rect(center=(center_x, y))))
             y += self._config.title_font_size + self._config.item_spacing * 2
 
         for i, item in enumerate(self._items):
@@ -116,7 +134,8 @@ class MenuScene(BaseScene):
                 if i == self._selected
                 else self._config.text_color
             )
-            text_surf = self._font.render(item.label, True, color)
-            text_rect = text_surf.get_rect(center=(center_x, y))
-            surface.blit(text_surf, text_rect)
+            text_surf = self._render_text(False, item.label, color)
+            blits.append((text_surf, text_surf.get_rect(center=(center_x, y))))
             y += self._config.font_size + self._config.item_spacing
+
+        surface.blits(blits, doreturn=False)
@@ -4,16 +4,19 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseGameState:
     """Base state that all game states should extend.
 
     Users subclass this and add their own fields:
 
-        @dataclass
+        @dataclass(slots=True)
         class MyState(BaseGameState):
             score: int = 0
             player_x: float = 100.0
+
+    slots=True is optional for subclasses, but without it their fields
+    live in an instance __dict__.
     """
 
     is_running: bool = True
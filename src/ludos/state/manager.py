@@ -1,7 +1,7 @@
 """Generic state manager."""
 
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from ludos.errors import StateError
 from ludos.state.base import BaseGameState
@@ -16,6 +16,7 @@ class StateManager(Generic[T]):
 
         manager = StateManager(MyState())
         manager.update(lambda s: setattr(s, 'score', s.score + 1))
+        manager.add('score', 1)  # same, without the callable
     """
 
     def __init__(self, initial_state: T) -> None:
@@ -45,6 +46,22 @@ class StateManager(Generic[T]):
         except Exception as e:
             raise StateError(f"State mutation failed: {e}") from e
 
+    def set(self, name: str, value: Any) -> None:
+        """Set one field without building a mutator callable."""
+        try:
+            setattr(self._state, name, value)
+            self._dirty = True
+        except Exception as e:
+            raise StateError(f"State mutation failed: {e}") from e
+
+    def add(self, name: str, delta: Any) -> None:
+        """Add *delta* to one field without building a mutator callable."""
+        try:
+            setattr(self._state, name, getattr(self._state, name) + delta)
+            self._dirty = True
+        except Exception as e:
+            raise StateError(f"State mutation failed: {e}") from e
+
     def mark_clean(self) -> None:
         """Reset the dirty flag after rendering."""
         self._dirty = False
@@ -67,3 +67,19 @@ class TestWindow:
         mock_display.flip.side_effect = pygame.error("flip failed")
         with pytest.raises(RenderError, match="Display flip failed"):
             window.flip()
+
+    @patch("ludos.display.window.pygame.display")
+    def test_update_passes_rects(self, mock_display):
+        mock_display.set_mode.return_value = MagicMock()
+        window = Window()
+        rects = [pygame.Rect(0, 0, 10, 10)]
+        window.update(rects)
+        mock_display.update.assert_called_once_with(rects)
+
+    @patch("ludos.display.window.pygame.display")
+    def test_update_error_wraps(self, mock_display):
+        mock_display.set_mode.return_value = MagicMock()
+        window = Window()
+        mock_display.update.side_effect = pygame.error("update failed")
+        with pytest.raises(RenderError, match="Display update failed"):
+            window.update([])
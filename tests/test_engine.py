@@ -4,6 +4,7 @@ import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
+import pygame
 import pytest
 
 from ludos.engine import EngineConfig, GameEngine
@@ -38,6 +39,8 @@ class TestEngineConfig:
         assert cfg.title == "Ludos"
         assert cfg.fps == 60
         assert cfg.bg_color == (0, 0, 0)
+        assert cfg.idle_fps == 10
+        assert cfg.precise_timing is False
 
     def test_custom(self):
         cfg = EngineConfig(width=1024, height=768, title="Test", fps=30)
@@ -196,6 +199,231 @@ class TestGameEngine:
         assert engine.state_manager.state.frame_count >= 1
 
 
+class IdleScene(StubScene):
+    """Scene that only asks for a redraw on its first frame."""
+
+    def needs_redraw(self, state):
+        return self.render_count == 0
+
+
+class RectScene(StubScene):
+    """Scene that reports one dirty rect per frame."""
+
+    def render(self, surface, state):
+        super().render(surface, state)
+        return [MagicMock()]
+
+
+class TestIdleRedraw:
+    def _run(self, mock_pg, scene, frames):
+        mock_clock = MagicMock()
+        mock_clock.tick.return_value = 16
+        mock_pg.time.Clock.return_value = mock_clock
+        engine = GameEngine(config=EngineConfig(fps=60, idle_fps=10), initial_scene=scene)
+        call_count = [0]
+
+        def poll_events():
+            call_count[0] += 1
+            if call_count[0] > frames:
+                engine.stop()
+            return []
+
+        with patch("ludos.engine.Window", return_value=MagicMock()) as window_cls:
+            with patch.object(engine._input_handler, "poll", side_effect=poll_events):
+                engine.run()
+        return mock_clock, window_cls.return_value
+
+    @patch("ludos.engine.pygame")
+    def test_render_skipped_when_no_redraw_needed(self, mock_pg):
+        scene = IdleScene()
+        _, window = self._run(mock_pg, scene, frames=3)
+        assert scene.update_count == 3
+        assert scene.render_count == 1
+        assert window.flip.call_count == 1
+
+    @patch("ludos.engine.pygame")
+    def test_idle_scene_waits_for_input(self, mock_pg):
+        clock, _ = self._run(mock_pg, IdleScene(), frames=3)
+        # The frame after the one that rendered is the first idle one: it
+        # blocks on the event queue for up to 1 / idle_fps instead of ticking
+        assert [c.args for c in clock.tick.call_args_list] == [(60,), (60,), (), ()]
+        assert [c.args for c in mock_pg.event.wait.call_args_list] == [(100,), (100,)]
+
+    def test_idle_fps_below_one_rejected(self):
+        with pytest.raises(InitializationError, match="idle_fps"):
+            GameEngine(config=EngineConfig(idle_fps=0))
+
+    @patch("ludos.engine.pygame")
+    def test_idle_wait_never_rounds_to_zero(self, mock_pg):
+        mock_clock = MagicMock()
+        mock_clock.tick.return_value = 16
+        mock_pg.time.Clock.return_value = mock_clock
+        engine = GameEngine(config=EngineConfig(idle_fps=2000), initial_scene=IdleScene())
+        call_count = [0]
+
+        def poll_events():
+            call_count[0] += 1
+            if call_count[0] > 2:
+                engine.stop()
+            return []
+
+        with patch("ludos.engine.Window", return_value=MagicMock()):
+            with patch.object(engine._input_handler, "poll", side_effect=poll_events):
+                engine.run()
+        assert [c.args for c in mock_pg.event.wait.call_args_list] == [(1,)]
+
+    @patch("ludos.engine.pygame")
+    def test_wait_for_input_requeues_event(self, mock_pg):
+        event = MagicMock()
+        mock_pg.event.wait.return_value = event
+        GameEngine._wait_for_input(100)
+        mock_pg.event.post.assert_called_once_with(event)
+
+    @patch("ludos.engine.pygame")
+    def test_wait_for_input_timeout_posts_nothing(self, mock_pg):
+        mock_pg.event.wait.return_value.type = mock_pg.NOEVENT
+        GameEngine._wait_for_input(100)
+        mock_pg.event.post.assert_not_called()
+
+    @patch("ludos.engine.pygame")
+    def test_default_scene_renders_every_frame(self, mock_pg):
+        scene = StubScene()
+        clock, window = self._run(mock_pg, scene, frames=3)
+        assert scene.render_count == 3
+        assert window.flip.call_count == 3
+        assert all(c.args[0] == 60 for c in clock.tick.call_args_list)
+
+    @patch("ludos.engine.pygame")
+    def test_precise_timing_busy_waits_only_while_drawing(self, mock_pg):
+        mock_clock = MagicMock()
+        mock_clock.tick.return_value = 16
+        mock_clock.tick_busy_loop.return_value = 16
+        mock_pg.time.Clock.return_value = mock_clock
+        engine = GameEngine(
+            config=EngineConfig(precise_timing=True), initial_scene=IdleScene()
+        )
+        call_count = [0]
+
+        def poll_events():
+            call_count[0] += 1
+            if call_count[0] > 3:
+                engine.stop()
+            return []
+
+        with patch("ludos.engine.Window", return_value=MagicMock()):
+            with patch.object(engine._input_handler, "poll", side_effect=poll_events):
+                engine.run()
+        assert [c.args[0] for c in mock_clock.tick_busy_loop.call_args_list] == [60, 60]
+        assert [c.args for c in mock_clock.tick.call_args_list] == [(), ()]
+
+    @patch("ludos.engine.pygame")
+    def test_returned_rects_update_display(self, mock_pg):
+        _, window = self._run(mock_pg, RectScene(), frames=3)
+        # The scene's first frame is a full flip, later ones push rects only
+        assert window.flip.call_count == 1
+        assert window.update.call_count == 2
+
+    @patch("ludos.engine.pygame")
+    def test_newly_active_scene_renders_first_frame(self, mock_pg):
+        class NeverRedraw(StubScene):
+            def needs_redraw(self, state):
+                return False
+
+        second = NeverRedraw()
+        first = IdleScene()
+        engine_ref = []
+
+        def push_on_input(event, state):
+            engine_ref[0].scene_manager.push(second, state)
+
+        mock_clock = MagicMock()
+        mock_clock.tick.return_value = 16
+        mock_pg.time.Clock.return_value = mock_clock
+        engine = GameEngine(initial_scene=first)
+        engine_ref.append(engine)
+        first.handle_input = push_on_input
+        call_count = [0]
+
+        def poll_events():
+            call_count[0] += 1
+            if call_count[0] > 4:
+                engine.stop()
+            return [InputEvent(InputType.KEY_DOWN)] if call_count[0] == 2 else []
+
+        with patch("ludos.engine.Window", return_value=MagicMock()):
+            with patch.object(engine._input_handler, "poll", side_effect=poll_events):
+                engine.run()
+        assert second.render_count == 1
+
+    @patch("ludos.engine.pygame")
+    def test_scene_change_from_input_does_not_idle(self, mock_pg):
+        class NeverRedraw(StubScene):
+            def needs_redraw(self, state):
+                return False
+
+        first = NeverRedraw()
+        second = NeverRedraw()
+        engine_ref = []
+
+        def push_on_input(event, state):
+            engine_ref[0].scene_manager.push(second, state)
+
+        mock_clock = MagicMock()
+        mock_clock.tick.return_value = 16
+        mock_pg.time.Clock.return_value = mock_clock
+        engine = GameEngine(initial_scene=first)
+        engine_ref.append(engine)
+        first.handle_input = push_on_input
+        call_count = [0]
+
+        def poll_events():
+            call_count[0] += 1
+            if call_count[0] > 3:
+                engine.stop()
+            return [InputEvent(InputType.KEY_DOWN)] if call_count[0] == 2 else []
+
+        with patch("ludos.engine.Window", return_value=MagicMock()):
+            with patch.object(engine._input_handler, "poll", side_effect=poll_events):
+                engine.run()
+        # The frame after the push draws the new scene without waiting
+        mock_pg.event.wait.assert_not_called()
+        assert second.render_count == 1
+
+
+class TestInputTypeFilter:
+    @patch("ludos.engine.pygame")
+    def test_unread_types_blocked_until_scene_changes(self, mock_pg):
+        class ClickScene(StubScene):
+            input_types = frozenset({InputType.MOUSE_DOWN})
+
+        engine = GameEngine()
+        engine._filter_events(ClickScene())
+        blocked = set(mock_pg.event.set_blocked.call_args.args[0])
+        assert pygame.MOUSEMOTION in blocked
+        assert pygame.KEYDOWN in blocked
+        assert pygame.MOUSEBUTTONDOWN not in blocked
+        assert pygame.QUIT not in blocked
+
+        # Same filter again is a no-op; an unfiltered scene allows everything
+        engine._filter_events(ClickScene())
+        assert mock_pg.event.set_blocked.call_count == 1
+        engine._filter_events(StubScene())
+        mock_pg.event.set_allowed.assert_called_with(None)
+        assert mock_pg.event.set_blocked.call_count == 1
+
+    @patch("ludos.engine.pygame")
+    def test_filter_lifted_on_shutdown(self, mock_pg):
+        class ClickScene(StubScene):
+            input_types = frozenset({InputType.MOUSE_DOWN})
+
+        engine = GameEngine()
+        engine._filter_events(ClickScene())
+        mock_pg.event.set_allowed.reset_mock()
+        engine._shutdown()
+        mock_pg.event.set_allowed.assert_called_once_with(None)
+        assert engine._input_types is None
+
+
 class ThrottledScene(BaseScene):
     """Scene with input repeat delay for throttle testing."""
 
@@ -282,6 +510,17 @@ class TestInputRepeatThrottle:
         engine._action_timestamps["move_up"] = time.monotonic() - 0.2
         assert engine._should_deliver(event, scene) is True
 
+    def test_events_share_poll_time(self):
+        """Events from one poll are judged against the same timestamp."""
+        scene = ThrottledScene()
+        engine = GameEngine()
+
+        event = InputEvent(type=InputType.KEY_DOWN, key=42, action="move_up")
+        assert engine._should_deliver(event, scene, now=10.0) is True
+        assert engine._should_deliver(event, scene, now=10.0) is False
+        assert engine._action_timestamps["move_up"] == 10.0
+        assert engine._should_deliver(event, scene, now=10.2) is True
+
     def test_throttle_resets_on_scene_change(self):
         """Switching scenes resets action timestamps."""
         engine = GameEngine()
@@ -22,6 +22,12 @@ class TestKeyBindings:
         bindings.bind_mouse(1, "click")
         assert bindings.get_mouse_action(1) == "click"
 
+    def test_action_names_interned(self):
+        bindings = KeyBindings()
+        bindings.bind_key(pygame.K_w, "".join(["move", "_up"]))
+        bindings.bind_mouse(1, "".join(["move", "_up"]))
+        assert bindings.get_key_action(pygame.K_w) is bindings.get_mouse_action(1)
+
     def test_unbind_key(self):
         bindings = KeyBindings()
         bindings.bind_key(pygame.K_w, "move_up")
@@ -107,3 +107,8 @@ class TestInputHandler:
         assert len(events) == 1
         assert events[0].type == InputType.MOUSE_MOTION
         assert events[0].pos == (50, 75)
+
+    def test_pygame_event_types(self):
+        types = InputHandler.pygame_event_types({InputType.KEY_DOWN, InputType.MOUSE_MOTION})
+        assert sorted(types) == sorted([pygame.KEYDOWN, pygame.MOUSEMOTION])
+        assert InputHandler.pygame_event_types([]) == []
@@ -56,6 +56,13 @@ class TestBaseScene:
         scene = SlowScene()
         assert scene.input_repeat_delay == 0.2
 
+    def test_needs_redraw_default(self):
+        scene = ConcreteScene()
+        assert scene.needs_redraw(BaseGameState()) is True
+
+    def test_input_types_default(self):
+        assert ConcreteScene().input_types is None
+
     def test_lifecycle_hooks_optional(self):
         # on_enter and on_exit have default no-op implementations
         class MinimalScene(BaseScene):
@@ -102,6 +102,31 @@ class TestMenuScene:
         menu.render(surface, self.state)
         # Title + 3 items = 4 render calls
         assert mock_font.render.call_count == 4
+        # ...drawn with a single blits() call
+        assert surface.blits.call_count == 1
+        assert len(surface.blits.call_args.args[0]) == 4
+
+    @patch("ludos.scenes.menu.pygame.font.Font")
+    def test_render_reuses_label_surfaces(self, mock_font_cls):
+        mock_font = mock_font_cls.return_value
+        surface = MagicMock()
+        surface.get_width.return_value = 800
+        surface.get_height.return_value = 600
+
+        self.menu.render(surface, self.state)
+        self.menu.render(surface, self.state)
+        assert mock_font.render.call_count == 3
+        # Only the two items whose colour changed are rendered again
+        self.menu.handle_input(_action_event("move_down"), self.state)
+        self.menu.render(surface, self.state)
+        assert mock_font.render.call_count == 5
+        self.menu.handle_input(_action_event("move_up"), self.state)
+        self.menu.render(surface, self.state)
+        assert mock_font.render.call_count == 5
+
+    def test_redraws_every_frame(self):
+        # Subclasses may animate in render(), so the menu never idles
+        assert self.menu.needs_redraw(self.state) is True
 
     def test_update_is_noop(self):
         self.menu.update(0.016, self.state)  # no error
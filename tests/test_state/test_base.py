@@ -38,3 +38,11 @@ class TestBaseGameState:
         state = MyState(is_running=False, health=50)
         assert state.is_running is False
         assert state.health == 50
+
+    def test_slotted(self):
+        @dataclass(slots=True)
+        class MyState(BaseGameState):
+            score: int = 0
+
+        assert not hasattr(BaseGameState(), "__dict__")
+        assert not hasattr(MyState(), "__dict__")
@@ -57,3 +57,29 @@ class SampleStateManager:
         manager = StateManager(SampleState())
         with pytest.raises(StateError, match="State mutation failed"):
             manager.update(lambda s: (_ for _ in ()).throw(ValueError("boom")))
+
+
+class TestSetAndAdd:
+    def test_set(self):
+        manager = StateManager(SampleState())
+        manager.set("score", 7)
+        assert manager.state.score == 7
+        assert manager.dirty is True
+
+    def test_add(self):
+        manager = StateManager(SampleState())
+        manager.add("score", 2)
+        manager.add("player_x", 0.5)
+        assert manager.state.score == 2
+        assert manager.state.player_x == 100.5
+        assert manager.dirty is True
+
+    def test_unknown_field_wraps_in_state_error(self):
+        manager = StateManager(SampleState())
+        with pytest.raises(StateError, match="State mutation failed"):
+            manager.add("missing", 1)
+
+    def test_bad_type_wraps_in_state_error(self):
+        manager = StateManager(SampleState())
+        with pytest.raises(StateError, match="State mutation failed"):
+            manager.add("score", "x")